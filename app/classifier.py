@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import re
 from typing import Optional
 
 from app.llm import LLMClient
@@ -11,21 +12,38 @@ _RULES = {
     Perspective.INDUSTRY: ["融资", "估值", "政策", "合作", "并购", "市场", "生态", "监管"],
 }
 
+# 关键词在导入时统一转小写，并映射到视角下标；分数用按下标访问的 list 存储。
+_PERSPECTIVES = tuple(Perspective)
+_RULE_KEYWORD_INDEX = {
+    kw.lower(): _PERSPECTIVES.index(p) for p, keywords in _RULES.items() for kw in keywords
+}
+# 所有规则关键词合并为一个交替正则，单次扫描文本即可拿到命中的关键词集合。
+_RULE_PATTERN = re.compile(
+    "|".join(re.escape(kw) for kw in sorted(_RULE_KEYWORD_INDEX, key=len, reverse=True))
+)
+
 
 def _rule_classify(text: str) -> Perspective | None:
     lowered = text.lower()
-    scores: dict[Perspective, int] = {p: 0 for p in Perspective}
-    for perspective, keywords in _RULES.items():
-        for kw in keywords:
-            if kw.lower() in lowered:
-                scores[perspective] += 1
-
-    top = sorted(scores.items(), key=lambda x: x[1], reverse=True)
-    if top[0][1] == 0:
+    scores = [0] * len(_PERSPECTIVES)
+    for kw in set(_RULE_PATTERN.findall(lowered)):
+        scores[_RULE_KEYWORD_INDEX[kw]] += 1
+
+    # 单次遍历取最高分与次高分，避免对分数排序
+    top_idx = 0
+    top_score = second_score = -1
+    for idx, score in enumerate(scores):
+        if score > top_score:
+            second_score = top_score
+            top_score = score
+            top_idx = idx
+        elif score > second_score:
+            second_score = score
+    if top_score == 0:
         return None
-    if len(top) > 1 and top[0][1] == top[1][1]:
+    if top_score == second_score:
         return None
-    return top[0][0]
+    return _PERSPECTIVES[top_idx]
 
 
 def _tag_classify(tags: list[str]) -> Optional[Perspective]:
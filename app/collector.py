@@ -4,11 +4,19 @@ import json
 import logging
 import os
 import re
+import threading
 import time as pytime
+from collections import OrderedDict
+from contextlib import contextmanager
+from functools import lru_cache
 from html import unescape
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from io import BytesIO
+from itertools import chain, zip_longest
 from typing import Iterable, Optional
-from urllib.parse import urljoin
+from urllib.parse import urljoin, urlsplit
 
 import feedparser
 import httpx
@@ -18,41 +26,94 @@ from dateutil import parser as dtparser
 from app.env_utils import load_local_env
 from app.models import RawItem, SourceConfig
 
+try:
+    from lxml import etree as lxml_etree
+
+    _HTML_PARSER = "lxml"
+except ImportError:
+    lxml_etree = None  # type: ignore[assignment]
+    _HTML_PARSER = "html.parser"
+
+try:
+    import h2  # noqa: F401
+
+    _HTTP2_ENABLED = True
+except ImportError:
+    _HTTP2_ENABLED = False
+
 logger = logging.getLogger(__name__)
 
-# 相对时间匹配：N小时前、N分钟前、昨天、N天前、今天
-_RELATIVE_PATTERNS = [
-    (re.compile(r"(\d+)\s*小时前"), lambda m: timedelta(hours=int(m.group(1)))),
-    (re.compile(r"(\d+)\s*分钟前"), lambda m: timedelta(minutes=int(m.group(1)))),
-    (re.compile(r"(\d+)\s*天前"), lambda m: timedelta(days=int(m.group(1)))),
-    (re.compile(r"刚刚"), lambda _: timedelta(minutes=0)),
-    (re.compile(r"昨天"), lambda _: timedelta(days=1)),
-    (re.compile(r"今天"), lambda _: timedelta(hours=0)),
-]
-
-_DATE_SNIPPET_PATTERNS = [
-    re.compile(
-        r"\d{4}[年/\-\.]\d{1,2}[月/\-\.]\d{1,2}(?:日|号)?(?:\s+\d{1,2}(?:[:：]\d{1,2}|点(?:\d{1,2})?))?"
-    ),
-    re.compile(r"\d{1,2}月\d{1,2}日(?:\s+\d{1,2}(?:[:：]\d{1,2}|点(?:\d{1,2})?))?"),
-    re.compile(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:\.\d+)?(?:Z|[+-]\d{2}:\d{2})"),
-    re.compile(
-        r"(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{1,2},\s+\d{4}(?:\s+\d{1,2}:\d{2})?",
-        flags=re.IGNORECASE,
-    ),
-]
+# 相对时间匹配：N小时前、N分钟前、N天前、刚刚、昨天、今天（合并为一个正则，按命中分组查表求偏移）
+_RELATIVE_PATTERN = re.compile(
+    r"(?P<hours>[0-9]+)\s*小时前"
+    r"|(?P<minutes>[0-9]+)\s*分钟前"
+    r"|(?P<days>[0-9]+)\s*天前"
+    r"|(?P<just_now>刚刚)"
+    r"|(?P<yesterday>昨天)"
+    r"|(?P<today>今天)"
+)
+_RELATIVE_WORDS = ("刚刚", "昨天", "今天")
+_ASCII_DIGIT_PATTERN = re.compile(r"[0-9]")
+_RELATIVE_DELTAS = {
+    "hours": lambda v: timedelta(hours=int(v)),
+    "minutes": lambda v: timedelta(minutes=int(v)),
+    "days": lambda v: timedelta(days=int(v)),
+    "just_now": lambda _: timedelta(minutes=0),
+    "yesterday": lambda _: timedelta(days=1),
+    "today": lambda _: timedelta(hours=0),
+}
+
+# 日期片段的四种形态合并为一个交替正则，单次扫描即可定位；同一位置按以下顺序优先匹配。
+# 每种形态一个命名分组，命中后按 lastgroup 分派到对应解析器，免去逐个试探。
+_DATE_SNIPPET_PATTERN = re.compile(
+    "|".join(
+        f"(?P<{kind}>{pattern})"
+        for kind, pattern in (
+            ("ymd", r"[0-9]{4}[年/\-\.][0-9]{1,2}[月/\-\.][0-9]{1,2}(?:日|号)?(?:\s+[0-9]{1,2}(?:[:：][0-9]{1,2}|点(?:[0-9]{1,2})?))?"),
+            ("md", r"[0-9]{1,2}月[0-9]{1,2}日(?:\s+[0-9]{1,2}(?:[:：][0-9]{1,2}|点(?:[0-9]{1,2})?))?"),
+            ("iso", r"[0-9]{4}-[0-9]{2}-[0-9]{2}T[0-9]{2}:[0-9]{2}:[0-9]{2}(?:\.[0-9]+)?(?:Z|[+-][0-9]{2}:[0-9]{2})"),
+            ("en", r"(?i:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)(?i:[a-z]*)\s+[0-9]{1,2},\s+[0-9]{4}(?:\s+[0-9]{1,2}:[0-9]{2})?"),
+        )
+    )
+)
+
+_ENGLISH_DATE_FORMATS = ("%b %d, %Y %H:%M", "%b %d, %Y", "%B %d, %Y %H:%M", "%B %d, %Y")
 
 _CHINESE_YMD_PATTERN = re.compile(
-    r"(?P<year>\d{4})\s*[年/\-\.]\s*(?P<month>\d{1,2})\s*[月/\-\.]\s*(?P<day>\d{1,2})\s*(?:日|号)?"
-    r"(?:\s*(?P<hour>\d{1,2})(?:\s*[:：点时]\s*(?P<minute>\d{1,2}))?)?"
+    r"(?P<year>[0-9]{4})\s*[年/\-\.]\s*(?P<month>[0-9]{1,2})\s*[月/\-\.]\s*(?P<day>[0-9]{1,2})\s*(?:日|号)?"
+    r"(?:\s*(?P<hour>[0-9]{1,2})(?:\s*[:：点时]\s*(?P<minute>[0-9]{1,2}))?)?"
 )
 _CHINESE_MD_PATTERN = re.compile(
-    r"(?P<month>\d{1,2})\s*月\s*(?P<day>\d{1,2})\s*日"
-    r"(?:\s*(?P<hour>\d{1,2})(?:\s*[:：点时]\s*(?P<minute>\d{1,2}))?)?"
+    r"(?P<month>[0-9]{1,2})\s*月\s*(?P<day>[0-9]{1,2})\s*日"
+    r"(?:\s*(?P<hour>[0-9]{1,2})(?:\s*[:：点时]\s*(?P<minute>[0-9]{1,2}))?)?"
+)
+# 子串预检：不含任何分隔符/中文日期字样时无需执行对应正则
+_CHINESE_YMD_SEPARATORS = ("年", "/", "-", ".")
+_UNIX_TIMESTAMP_PATTERN = re.compile(r"[0-9]{10}|[0-9]{13}")
+_JSONLD_DATE_KEYS = frozenset({"datepublished", "datecreated", "datemodified", "uploaddate"})
+# 常见写法直接命中；其余大小写变体仅在长度吻合时才小写比对，免去逐键 lower()
+_JSONLD_DATE_KEY_VARIANTS = _JSONLD_DATE_KEYS | frozenset(
+    {"datePublished", "dateCreated", "dateModified", "uploadDate"}
+)
+_JSONLD_DATE_KEY_LENGTHS = frozenset(len(key) for key in _JSONLD_DATE_KEYS)
+# JSON-LD 原文预检：不含任何日期键时跳过 json.loads 与遍历
+_JSONLD_DATE_KEY_PATTERN = re.compile("|".join(sorted(_JSONLD_DATE_KEYS)), re.IGNORECASE)
+
+# 文章页 meta 日期标签，按顺序决定候选优先级
+_META_DATE_ATTRS = (
+    ("property", "article:published_time"),
+    ("property", "article:modified_time"),
+    ("name", "pubdate"),
+    ("name", "publishdate"),
+    ("name", "publish-date"),
+    ("name", "date"),
+    ("itemprop", "datePublished"),
+    ("itemprop", "dateCreated"),
+    ("itemprop", "dateModified"),
 )
-_JSONLD_DATE_KEYS = {"datepublished", "datecreated", "datemodified", "uploaddate"}
+_META_DATE_PRIORITY = {pair: idx for idx, pair in enumerate(_META_DATE_ATTRS)}
 
-_NOISE_TITLE_WORDS = {
+_NOISE_TITLE_WORDS = frozenset({
     "登录",
     "注册",
     "关于",
@@ -67,8 +128,45 @@ _NOISE_TITLE_WORDS = {
     "app ",
     "learn more",
     "more",
+})
+
+# 按长度降序拼接，避免依赖集合迭代顺序（字符串哈希随进程随机化）
+_NOISE_TITLE_PATTERN = re.compile(
+    "|".join(re.escape(word) for word in sorted(_NOISE_TITLE_WORDS, key=lambda w: (-len(w), w)))
+)
+
+# 文章正文中提示发布时间的标记词，按优先级排列
+_DATE_MARKERS = ("发布时间", "发布于", "发表于", "更新于", "日期")
+_DATE_MARKER_PATTERN = re.compile("|".join(_DATE_MARKERS))
+
+# HTML 源单次最多产出的条目数，以及文章页回源的并发数
+_MAX_HTML_ITEMS = 30
+_DETAIL_FETCH_WORKERS = 8
+# 文章页解析出的发布时间按 URL 缓存，常驻调度时各轮次不再重复回源；
+# 未解析出日期的页面不缓存，页面补上日期或解析规则更新后下轮即可生效
+_ARTICLE_DATE_CACHE_SIZE = 4096
+_ARTICLE_DATE_CACHE: OrderedDict[str, datetime] = OrderedDict()
+_ARTICLE_DATE_CACHE_LOCK = threading.Lock()
+# 单个 HTML 响应最多读取的字节数（列表页/文章页的有效信息都在前部），超出部分不再下载
+_MAX_HTML_BYTES = 2_000_000
+
+# 条件请求缓存：来源配置指纹 -> (ETag, Last-Modified, 上次解析出的条目)；常驻调度时跨轮次复用。
+# 指纹取整份来源配置，修改过滤关键词等配置后旧条目自然失效。
+_CONDITIONAL_CACHE_SIZE = 512
+_CONDITIONAL_CACHE: OrderedDict[str, tuple[str, str, list[RawItem]]] = OrderedDict()
+_CONDITIONAL_CACHE_LOCK = threading.Lock()
+
+# RSS/Atom 日期字段到 feedparser 风格键名的映射
+_FEED_DATE_FIELDS = {
+    "pubDate": "published",
+    "published": "published",
+    "issued": "published",
+    "date": "published",
+    "updated": "updated",
+    "modified": "updated",
 }
 
+_WECHAT_BIZ_PATTERN = re.compile(r"__biz=([A-Za-z0-9_=]+)")
 _WECHAT_MP_MOBILE_HEADERS = {
     "User-Agent": (
         "Mozilla/5.0 (iPhone; CPU iPhone OS 16_6 like Mac OS X) "
@@ -96,19 +194,52 @@ _WECHAT_VAR_PATTERNS = {
     "sn": re.compile(r'var\s+sn\s*=\s*"([A-Za-z0-9]+)"'),
 }
 
-_PUBLISHER_PATTERNS = [
+# 发布方识别规则按优先级排列，逐条独立匹配：合并成一个交替正则时各规则的命中不能重叠，
+# 低优先级规则的捕获会吞掉高优先级规则的标记（如“来源：作者：张三”）
+_PUBLISHER_PATTERNS = (
     re.compile(r"本文来自微信公众号[:：]\s*([^\s，。；;、\"“”'’<]{2,40})"),
     re.compile(r"作者\s*[：:]\s*[\"“]?([A-Za-z0-9_\-\u4e00-\u9fff·]{2,40})"),
     re.compile(r"作者\s*\"([A-Za-z0-9_\-\u4e00-\u9fff·]{2,40})\""),
     re.compile(r"来源\s*[：:]\s*([A-Za-z0-9_\-\u4e00-\u9fff·]{2,40})"),
-]
+)
+
 
+@lru_cache(maxsize=None)
+def _compile_pattern(pattern: str) -> re.Pattern[str]:
+    """编译以字符串传入的动态正则，同一模式只编译一次。"""
+    return re.compile(pattern)
 
+
+def _parse_iso_datetime(value: str) -> datetime | None:
+    text = value.strip()
+    if text.endswith(("Z", "z")):
+        text = text[:-1] + "+00:00"
+    try:
+        return datetime.fromisoformat(text)
+    except ValueError:
+        return None
+
+
+def _parse_english_datetime(value: str) -> datetime | None:
+    """英文月份日期（Nov 20, 2024 [10:00]）用 strptime 定长格式直解，失败再走通用解析。"""
+    text = " ".join(value.split())
+    for fmt in _ENGLISH_DATE_FORMATS:
+        try:
+            return datetime.strptime(text, fmt).replace(tzinfo=timezone.utc)
+        except ValueError:
+            continue
+    return _parse_datetime(value)
+
+
+@lru_cache(maxsize=4096)
 def _parse_datetime(value: str | None) -> datetime | None:
     if not value:
         return None
     try:
-        parsed = dtparser.parse(value, fuzzy=True)
+        parsed = _parse_iso_datetime(value)
+        if parsed is None:
+            # 仅在非 ISO 格式时才走 dateutil 的模糊解析（最慢的路径）
+            parsed = dtparser.parse(value, fuzzy=True)
         if parsed.tzinfo is None:
             parsed = parsed.replace(tzinfo=timezone.utc)
         return parsed.astimezone(timezone.utc)
@@ -116,9 +247,41 @@ def _parse_datetime(value: str | None) -> datetime | None:
         return None
 
 
+def _is_ascii_digits(text: str) -> bool:
+    return text.isascii() and text.isdigit()
+
+
+def _scan_fixed_width_ymd(text: str) -> tuple[int, int, int, int, int] | None:
+    """定宽日期的快速路径：YYYY-MM-DD / YYYY年MM月DD日，可带“ HH:MM”；其他形态返回 None 交给正则。"""
+    if len(text) < 10 or text[4] not in "年/-." or text[7] not in "月/-.":
+        return None
+    year, month, day = text[0:4], text[5:7], text[8:10]
+    if not _is_ascii_digits(year + month + day):
+        return None
+    rest = text[10:]
+    if rest[:1] in ("日", "号"):
+        rest = rest[1:]
+    if not rest:
+        return int(year), int(month), int(day), 0, 0
+    if len(rest) == 6 and rest[0] == " " and rest[3] in ":：":
+        hour, minute = rest[1:3], rest[4:6]
+        if _is_ascii_digits(hour + minute):
+            return int(year), int(month), int(day), int(hour), int(minute)
+    return None
+
+
 def _parse_chinese_datetime(value: str, ref_time: datetime) -> datetime | None:
     text = value.strip()
-    match = _CHINESE_YMD_PATTERN.search(text)
+    fields = _scan_fixed_width_ymd(text)
+    if fields:
+        try:
+            return datetime(*fields, tzinfo=timezone.utc)
+        except ValueError:
+            return None
+
+    match = None
+    if any(sep in text for sep in _CHINESE_YMD_SEPARATORS):
+        match = _CHINESE_YMD_PATTERN.search(text)
     if match:
         year = int(match.group("year"))
         month = int(match.group("month"))
@@ -130,6 +293,8 @@ def _parse_chinese_datetime(value: str, ref_time: datetime) -> datetime | None:
         except ValueError:
             return None
 
+    if "月" not in text or "日" not in text:
+        return None
     match = _CHINESE_MD_PATTERN.search(text)
     if match:
         year = ref_time.year
@@ -149,7 +314,7 @@ def _parse_chinese_datetime(value: str, ref_time: datetime) -> datetime | None:
 
 def _parse_unix_timestamp(value: str) -> datetime | None:
     text = value.strip()
-    if not re.fullmatch(r"\d{10}|\d{13}", text):
+    if not _UNIX_TIMESTAMP_PATTERN.fullmatch(text):
         return None
     try:
         timestamp = int(text)
@@ -163,21 +328,22 @@ def _parse_unix_timestamp(value: str) -> datetime | None:
         return None
 
 
-def _extract_date_snippet(text: str, regex: Optional[str] = None) -> str | None:
+def _extract_date_snippet(
+    text: str, regex: str | re.Pattern[str] | None = None
+) -> tuple[str, Optional[str]] | None:
+    """返回 (日期片段, 形态)；形态为内置正则的分组名，源配置正则命中时为 None。"""
     if regex:
-        match = re.search(regex, text)
-        if match:
-            return match.group(0).strip()
-    for pattern in _DATE_SNIPPET_PATTERNS:
+        pattern = regex if isinstance(regex, re.Pattern) else _compile_pattern(regex)
         match = pattern.search(text)
         if match:
-            return match.group(0).strip()
-    return None
+            return match.group(0).strip(), None
+    match = _DATE_SNIPPET_PATTERN.search(text)
+    return (match.group(0).strip(), match.lastgroup) if match else None
 
 
 def _parse_html_date(
     text: str,
-    regex: Optional[str] = None,
+    regex: str | re.Pattern[str] | None = None,
     ref_time: Optional[datetime] = None,
     allow_relative: bool = True,
 ) -> Optional[datetime]:
@@ -185,23 +351,41 @@ def _parse_html_date(
     if not text or not text.strip():
         return None
     text = text.strip()
-    ref = ref_time or datetime.now(timezone.utc)
+    # 内置日期形态都含 ASCII 数字，无数字的相对时间只有“刚刚/昨天/今天”；都不含时无需跑正则
+    if not regex and not _ASCII_DIGIT_PATTERN.search(text):
+        if not allow_relative or not any(word in text for word in _RELATIVE_WORDS):
+            return None
+    if ref_time is None:
+        return _parse_html_date_uncached(text, regex, datetime.now(timezone.utc), allow_relative)
+    # 同一批次共享 ref_time，列表页上重复出现的日期文本可直接命中缓存
+    return _parse_html_date_cached(text, regex, ref_time, allow_relative)
+
 
+def _parse_html_date_uncached(
+    text: str,
+    regex: str | re.Pattern[str] | None,
+    ref: datetime,
+    allow_relative: bool,
+) -> Optional[datetime]:
     # 相对时间
     if allow_relative and len(text) <= 80:
-        for pattern, delta_fn in _RELATIVE_PATTERNS:
-            m = pattern.search(text)
-            if m:
-                delta = delta_fn(m)
-                return (ref - delta).astimezone(timezone.utc)
-
-    snippet = _extract_date_snippet(text, regex=regex)
-    if not snippet:
+        m = _RELATIVE_PATTERN.search(text)
+        if m and m.lastgroup:
+            delta = _RELATIVE_DELTAS[m.lastgroup](m.group(m.lastgroup))
+            return (ref - delta).astimezone(timezone.utc)
+
+    found = _extract_date_snippet(text, regex=regex)
+    if not found:
         return None
+    snippet, kind = found
+    if kind == "en":
+        return _parse_english_datetime(snippet)
 
-    ts = _parse_unix_timestamp(snippet)
-    if ts:
-        return ts
+    # 内置形态都带分隔符，不可能是纯数字时间戳；只有源配置正则的片段需要尝试
+    if kind is None:
+        ts = _parse_unix_timestamp(snippet)
+        if ts:
+            return ts
 
     parsed = _parse_chinese_datetime(snippet, ref)
     if parsed:
@@ -209,10 +393,13 @@ def _parse_html_date(
     return _parse_datetime(snippet)
 
 
+_parse_html_date_cached = lru_cache(maxsize=4096)(_parse_html_date_uncached)
+
+
 def _extract_date_from_element(
     elem,
     date_attr: Optional[str],
-    date_regex: Optional[str],
+    date_regex: str | re.Pattern[str] | None,
     ref_time: datetime,
 ) -> Optional[datetime]:
     """从 DOM 元素提取发布时间。"""
@@ -223,61 +410,72 @@ def _extract_date_from_element(
 
 
 def _extract_date_from_json_ld(payload, ref_time: datetime) -> datetime | None:
-    if isinstance(payload, list):
-        for item in payload:
-            parsed = _extract_date_from_json_ld(item, ref_time)
-            if parsed:
-                return parsed
-        return None
-    if not isinstance(payload, dict):
-        return None
+    # 显式栈迭代遍历；先检查当前节点的日期字段，再按原顺序下探 dict/list 子节点。
+    stack = [payload]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, list):
+            stack.extend(reversed(node))
+            continue
+        if not isinstance(node, dict):
+            continue
 
-    for key, value in payload.items():
-        lowered_key = key.lower()
-        if lowered_key in _JSONLD_DATE_KEYS and isinstance(value, str):
-            parsed = _parse_html_date(value, ref_time=ref_time)
-            if parsed:
-                return parsed
-        parsed = _extract_date_from_json_ld(value, ref_time)
-        if parsed:
-            return parsed
+        children = []
+        for key, value in node.items():
+            if isinstance(value, str):
+                if key in _JSONLD_DATE_KEY_VARIANTS or (
+                    len(key) in _JSONLD_DATE_KEY_LENGTHS and key.lower() in _JSONLD_DATE_KEYS
+                ):
+                    parsed = _parse_html_date(value, ref_time=ref_time)
+                    if parsed:
+                        return parsed
+            elif isinstance(value, (dict, list)):
+                children.append(value)
+        stack.extend(reversed(children))
     return None
 
 
-def _extract_article_published_at(html: str, ref_time: datetime) -> datetime | None:
-    soup = BeautifulSoup(html, "html.parser")
-    candidates: list[str] = []
-
-    meta_selectors = [
-        ("meta[property='article:published_time']", "content"),
-        ("meta[property='article:modified_time']", "content"),
-        ("meta[name='pubdate']", "content"),
-        ("meta[name='publishdate']", "content"),
-        ("meta[name='publish-date']", "content"),
-        ("meta[name='date']", "content"),
-        ("meta[itemprop='datePublished']", "content"),
-        ("meta[itemprop='dateCreated']", "content"),
-        ("meta[itemprop='dateModified']", "content"),
-    ]
-    for selector, attr in meta_selectors:
-        for elem in soup.select(selector):
-            value = (elem.get(attr) or "").strip()
-            if value:
-                candidates.append(value)
-
-    for elem in soup.select("time"):
-        value = (elem.get("datetime") or elem.get_text(" ", strip=True) or "").strip()
-        if value:
-            candidates.append(value)
-
+def _parse_html(html: str) -> BeautifulSoup:
+    """统一的 HTML 解析入口：优先使用 C 实现的 lxml，未安装时回退到标准库解析器。"""
+    return BeautifulSoup(html, _HTML_PARSER)
+
+
+def _extract_article_published_at(soup: BeautifulSoup, ref_time: datetime) -> datetime | None:
+    # 单次遍历收集 meta / time / JSON-LD 候选，meta 按 _META_DATE_PRIORITY 的优先级排序。
+    meta_candidates: list[tuple[int, str]] = []
+    time_elems = []
+    json_ld_scripts = []
+    for elem in soup.find_all(("meta", "time", "script")):
+        if elem.name == "meta":
+            priorities = [
+                _META_DATE_PRIORITY[(attr, elem.get(attr))]
+                for attr in ("property", "name", "itemprop")
+                if (attr, elem.get(attr)) in _META_DATE_PRIORITY
+            ]
+            value = (elem.get("content") or "").strip()
+            if priorities and value:
+                meta_candidates.append((min(priorities), value))
+        elif elem.name == "time":
+            time_elems.append(elem)
+        elif elem.get("type") == "application/ld+json":
+            json_ld_scripts.append(elem)
+
+    meta_candidates.sort(key=lambda x: x[0])
+    # 结构化候选按需惰性取值：meta 命中后不再提取 <time> 文本
+    candidates = chain(
+        (value for _, value in meta_candidates),
+        ((elem.get("datetime") or elem.get_text(" ", strip=True) or "").strip() for elem in time_elems),
+    )
     for value in candidates:
+        if not value:
+            continue
         parsed = _parse_html_date(value, ref_time=ref_time)
         if parsed:
             return parsed
 
-    for script in soup.select("script[type='application/ld+json']"):
+    for script in json_ld_scripts:
         payload = (script.string or script.get_text() or "").strip()
-        if not payload:
+        if not payload or not _JSONLD_DATE_KEY_PATTERN.search(payload):
             continue
         try:
             parsed = _extract_date_from_json_ld(json.loads(payload), ref_time)
@@ -287,9 +485,13 @@ def _extract_article_published_at(html: str, ref_time: datetime) -> datetime | N
             continue
 
     body_text = soup.get_text(" ", strip=True)
-    for marker in ("发布时间", "发布于", "发表于", "更新于", "日期"):
-        idx = body_text.find(marker)
-        if idx >= 0:
+    # 单次扫描记录每个标记词的首次出现位置，再按 _DATE_MARKERS 的优先级尝试解析
+    marker_positions: dict[str, int] = {}
+    for match in _DATE_MARKER_PATTERN.finditer(body_text):
+        marker_positions.setdefault(match.group(0), match.start())
+    for marker in _DATE_MARKERS:
+        idx = marker_positions.get(marker)
+        if idx is not None:
             snippet = body_text[idx : idx + 120]
             parsed = _parse_html_date(snippet, ref_time=ref_time)
             if parsed:
@@ -298,20 +500,28 @@ def _extract_article_published_at(html: str, ref_time: datetime) -> datetime | N
     return _parse_html_date(body_text[:4000], ref_time=ref_time, allow_relative=False)
 
 
-def _matches_required_keywords(source: SourceConfig, *parts: str) -> bool:
-    required = [kw.strip() for kw in source.required_keywords_any if kw and kw.strip()]
+@lru_cache(maxsize=256)
+def _compile_keywords_pattern(keywords: tuple[str, ...]) -> re.Pattern[str] | None:
+    """将关键词列表编译为一个交替正则（小写），同一组关键词只编译一次。"""
+    required = sorted({kw.strip().lower() for kw in keywords if kw and kw.strip()}, key=len, reverse=True)
     if not required:
+        return None
+    return re.compile("|".join(re.escape(kw) for kw in required))
+
+
+def _matches_required_keywords(source: SourceConfig, *parts: str) -> bool:
+    pattern = _compile_keywords_pattern(tuple(source.required_keywords_any))
+    if pattern is None:
         return True
     haystack = " ".join(parts).lower()
-    return any(kw.lower() in haystack for kw in required)
+    return pattern.search(haystack) is not None
 
 
 def _matches_required_author_keywords(source: SourceConfig, author: str) -> bool:
-    required = [kw.strip() for kw in source.required_author_keywords_any if kw and kw.strip()]
-    if not required:
+    pattern = _compile_keywords_pattern(tuple(source.required_author_keywords_any))
+    if pattern is None:
         return True
-    author_lower = author.lower()
-    return any(kw.lower() in author_lower for kw in required)
+    return pattern.search(author.lower()) is not None
 
 
 def _extract_publisher_from_text(text: str) -> str:
@@ -338,12 +548,11 @@ def _to_canonical_wechat_article_url(client: httpx.Client, url: str) -> str:
     if "mp.weixin.qq.com/s?" not in url:
         return url
     try:
-        resp = client.get(url, headers=_WECHAT_MP_MOBILE_HEADERS)
+        resp, text = _get_html(client, url, headers=_WECHAT_MP_MOBILE_HEADERS)
         resp.raise_for_status()
     except Exception:  # noqa: BLE001
         return url
 
-    text = resp.text
     values: dict[str, str] = {}
     for key, pattern in _WECHAT_VAR_PATTERNS.items():
         match = pattern.search(text)
@@ -362,33 +571,73 @@ def _resolve_item_url(source: SourceConfig, client: httpx.Client, url: str) -> s
     if "weixin.sogou.com/link?" not in url:
         return url
     try:
-        resp = client.get(url, headers=_SOGOU_BROWSER_HEADERS)
+        resp, text = _get_html(client, url, headers=_SOGOU_BROWSER_HEADERS)
         resp.raise_for_status()
     except Exception:  # noqa: BLE001
         return url
 
-    resolved = _extract_sogou_redirect_url(resp.text)
+    resolved = _extract_sogou_redirect_url(text)
     if not resolved:
         return url
     return _to_canonical_wechat_article_url(client, resolved)
 
 
-def _fetch_article_published_at(client: httpx.Client, url: str, ref_time: datetime) -> datetime | None:
+def _get_html(client: httpx.Client, url: str, headers: dict[str, str] | None = None):
+    """流式读取 HTML 响应，最多 _MAX_HTML_BYTES 字节；返回 (resp, 文本)，超大页面不再整页下载。"""
+    body = bytearray()
+    with client.stream("GET", url, headers=headers) as resp:
+        for chunk in resp.iter_bytes():
+            body += chunk
+            if len(body) >= _MAX_HTML_BYTES:
+                logger.warning("Truncate oversized html response: %s | bytes>=%d", url, _MAX_HTML_BYTES)
+                del body[_MAX_HTML_BYTES:]
+                break
     try:
-        resp = client.get(url)
-        resp.raise_for_status()
-    except Exception:  # noqa: BLE001
-        return None
-    return _extract_article_published_at(resp.text, ref_time)
+        return resp, body.decode(resp.encoding or "utf-8", errors="replace")
+    except LookupError:
+        return resp, body.decode("utf-8", errors="replace")
 
 
-def _fetch_article_publisher(client: httpx.Client, url: str) -> str:
+def _fetch_article_soup(client: httpx.Client, url: str) -> BeautifulSoup | None:
     try:
-        resp = client.get(url)
+        resp, html = _get_html(client, url)
         resp.raise_for_status()
     except Exception:  # noqa: BLE001
-        return ""
-    soup = BeautifulSoup(resp.text, "html.parser")
+        return None
+    return _parse_html(html)
+
+
+def _lookup_article_date(url: str) -> Optional[datetime]:
+    with _ARTICLE_DATE_CACHE_LOCK:
+        published = _ARTICLE_DATE_CACHE.get(url)
+        if published is not None:
+            _ARTICLE_DATE_CACHE.move_to_end(url)
+        return published
+
+
+def _remember_article_date(url: str, published: Optional[datetime]) -> None:
+    if published is None:
+        return
+    with _ARTICLE_DATE_CACHE_LOCK:
+        _ARTICLE_DATE_CACHE[url] = published
+        _ARTICLE_DATE_CACHE.move_to_end(url)
+        while len(_ARTICLE_DATE_CACHE) > _ARTICLE_DATE_CACHE_SIZE:
+            _ARTICLE_DATE_CACHE.popitem(last=False)
+
+
+def _fetch_article_published_at(client: httpx.Client, url: str, ref_time: datetime) -> datetime | None:
+    published = _lookup_article_date(url)
+    if published is not None:
+        return published
+    soup = _fetch_article_soup(client, url)
+    if soup is None:
+        return None
+    published = _extract_article_published_at(soup, ref_time)
+    _remember_article_date(url, published)
+    return published
+
+
+def _extract_article_publisher(soup: BeautifulSoup) -> str:
     text = soup.get_text(" ", strip=True)
     return _extract_publisher_from_text(text[:8000])
 
@@ -418,14 +667,162 @@ def _extract_rss_published_at(entry, content: str, client: httpx.Client, ref_tim
     return None
 
 
+def _xml_localname(tag) -> str:
+    return tag.rsplit("}", 1)[-1] if isinstance(tag, str) else ""
+
+
+def _parse_feed_struct_time(value: str) -> pytime.struct_time | None:
+    try:
+        parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return None
+    if parsed is None:
+        return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc)
+    return parsed.timetuple()
+
+
+def _feed_entry_from_element(elem, feed_url: str = "") -> dict:
+    """把 RSS item / Atom entry 元素转换为与 feedparser entry 同名字段的 dict。
+
+    相对链接与 feedparser 一致按 xml:base（含祖先节点）解析，未声明时相对 feed_url。
+    """
+    entry: dict = {}
+    for child in elem:
+        name = _xml_localname(child.tag)
+        if name == "link":
+            href = (child.get("href") or "").strip()
+            if href and child.get("rel", "alternate") == "alternate":
+                entry.setdefault("link", urljoin(child.base or feed_url, href))
+            elif not href and child.text and child.text.strip():
+                entry.setdefault("link", urljoin(child.base or feed_url, child.text.strip()))
+            continue
+
+        if name == "author":
+            author_name = next((c for c in child if _xml_localname(c.tag) == "name"), None)
+            text = "".join((author_name if author_name is not None else child).itertext()).strip()
+        else:
+            text = "".join(child.itertext()).strip()
+
+        if name == "title":
+            entry.setdefault("title", text)
+        elif name in ("description", "summary"):
+            entry.setdefault("summary", text)
+        elif name in ("encoded", "content"):
+            entry.setdefault("content", []).append({"value": text})
+        elif name in ("author", "creator"):
+            entry.setdefault("author", text)
+        elif name in _FEED_DATE_FIELDS:
+            key = _FEED_DATE_FIELDS[name]
+            entry.setdefault(key, text)
+            parsed_struct = _parse_feed_struct_time(text)
+            if parsed_struct is not None:
+                entry.setdefault(f"{key}_parsed", parsed_struct)
+    return entry
+
+
+def _iterparse_feed_entries(content: bytes, feed_url: str = "") -> list[dict]:
+    entries: list[dict] = []
+    context = lxml_etree.iterparse(
+        BytesIO(content),
+        events=("end",),
+        tag=("{*}item", "{*}entry"),
+        resolve_entities=False,
+        no_network=True,
+    )
+    for _, elem in context:
+        entries.append(_feed_entry_from_element(elem, feed_url))
+        # 流式解析：处理完即释放已遍历的节点，避免整棵树常驻内存
+        elem.clear()
+        parent = elem.getparent()
+        while parent is not None and elem.getprevious() is not None:
+            del parent[0]
+    return entries
+
+
+def _parse_feed_entries(resp, feed_url: str = "") -> list:
+    """优先用 lxml 流式解析 RSS/Atom，只取采集需要的字段；解析失败或格式特殊时回退 feedparser。
+
+    feed_url 作为相对链接的兜底基准（未声明 xml:base 时），两条解析路径一致。
+    """
+    content = getattr(resp, "content", None)
+    if lxml_etree is not None and isinstance(content, bytes):
+        try:
+            entries = _iterparse_feed_entries(content, feed_url)
+        except (lxml_etree.XMLSyntaxError, ValueError):
+            entries = []
+        if entries:
+            return entries
+    response_headers = {"content-location": feed_url} if feed_url else None
+    if isinstance(content, bytes):
+        # 直接交给 feedparser 原始字节，由其按 XML 声明识别编码，省去一次解码
+        return feedparser.parse(BytesIO(content), response_headers=response_headers).entries
+    return feedparser.parse(resp.text, response_headers=response_headers).entries
+
+
+def _conditional_key(source: SourceConfig) -> str:
+    return source.model_dump_json()
+
+
+def _conditional_get(client: httpx.Client, source: SourceConfig, read_html: bool = False):
+    """携带上次的 ETag / Last-Modified 发起条件请求；返回 (resp, HTML 文本, 304 时复用的缓存条目)。
+
+    read_html 为真时按 _get_html 流式读取有上限的正文，否则 HTML 文本为空串、由调用方自行读取响应。
+    """
+    key = _conditional_key(source)
+    with _CONDITIONAL_CACHE_LOCK:
+        cached = _CONDITIONAL_CACHE.get(key)
+        if cached:
+            _CONDITIONAL_CACHE.move_to_end(key)
+    headers: dict[str, str] | None = None
+    if cached:
+        etag, last_modified, items = cached
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+    if read_html:
+        resp, html = _get_html(client, source.url, headers=headers)
+    elif headers is None:
+        resp, html = client.get(source.url), ""
+    else:
+        resp, html = client.get(source.url, headers=headers), ""
+    if not cached or getattr(resp, "status_code", None) != 304:
+        return resp, html, None
+    now = datetime.now(timezone.utc)
+    return resp, html, [item.model_copy(update={"discovered_at": now}) for item in items]
+
+
+def _remember_conditional(source: SourceConfig, resp, items: list[RawItem], complete: bool = True) -> None:
+    """记录本轮条目供 304 时复用；complete 为假（有链接抓取失败或未解析出日期）时不缓存，下轮整页重试。"""
+    headers = getattr(resp, "headers", None)
+    etag = headers.get("ETag") if headers is not None else None
+    last_modified = headers.get("Last-Modified") if headers is not None else None
+    etag = etag if isinstance(etag, str) else ""
+    last_modified = last_modified if isinstance(last_modified, str) else ""
+    key = _conditional_key(source)
+    with _CONDITIONAL_CACHE_LOCK:
+        if not complete or not (etag or last_modified):
+            _CONDITIONAL_CACHE.pop(key, None)
+            return
+        _CONDITIONAL_CACHE[key] = (etag, last_modified, list(items))
+        _CONDITIONAL_CACHE.move_to_end(key)
+        while len(_CONDITIONAL_CACHE) > _CONDITIONAL_CACHE_SIZE:
+            _CONDITIONAL_CACHE.popitem(last=False)
+
+
 def _collect_rss(source: SourceConfig, client: httpx.Client) -> list[RawItem]:
-    resp = client.get(source.url)
+    resp, _, cached_items = _conditional_get(client, source)
+    if cached_items is not None:
+        logger.info("Source not modified, reuse cached items: %s", source.name)
+        return cached_items
     resp.raise_for_status()
-    parsed = feedparser.parse(resp.text)
 
-    items: list[RawItem] = []
+    candidates: list[tuple[dict, str, str, str]] = []
     now = datetime.now(timezone.utc)
-    for entry in parsed.entries:
+    for entry in _parse_feed_entries(resp, source.url):
         title = (entry.get("title") or "").strip()
         link = (entry.get("link") or "").strip()
         if not title or not link:
@@ -447,10 +844,24 @@ def _collect_rss(source: SourceConfig, client: httpx.Client) -> list[RawItem]:
         if not _matches_required_author_keywords(source, author):
             logger.debug("Drop rss item not matching author keywords: %s | %s | author=%s", source.name, title, author)
             continue
+        candidates.append((entry, title, link, content))
 
-        published = _extract_rss_published_at(entry, content, client, now)
+    if not candidates:
+        _remember_conditional(source, resp, [])
+        return []
+
+    # 缺少日期的条目需回源文章页，与 HTML 源一致并发解析，结果按条目顺序收集
+    items: list[RawItem] = []
+    with ThreadPoolExecutor(max_workers=_DETAIL_FETCH_WORKERS) as executor:
+        results = executor.map(
+            lambda candidate: _extract_rss_published_at(candidate[0], candidate[3], client, now), candidates
+        )
+        rows = list(zip(candidates, results))
+    complete = True
+    for (_, title, link, content), published in rows:
         if not published:
             logger.debug("Drop rss item without published_at: %s | %s", source.name, link)
+            complete = False
             continue
 
         items.append(
@@ -465,6 +876,7 @@ def _collect_rss(source: SourceConfig, client: httpx.Client) -> list[RawItem]:
                 tags=source.tags,
             )
         )
+    _remember_conditional(source, resp, items, complete)
     return items
 
 
@@ -472,7 +884,7 @@ def _collect_wechat_profile(source: SourceConfig, client: httpx.Client) -> list[
     load_local_env()
     biz = (source.wechat_biz or "").strip()
     if not biz:
-        match = re.search(r"__biz=([A-Za-z0-9_=]+)", source.url)
+        match = _WECHAT_BIZ_PATTERN.search(source.url)
         if match:
             biz = match.group(1)
     if not biz:
@@ -578,26 +990,37 @@ def _extract_nearby_date(anchor, ref_time: datetime) -> datetime | None:
 def _extract_page_links(
     source: SourceConfig, html: str, ref_time: datetime
 ) -> Iterable[tuple[str, str, Optional[datetime], str, str]]:
-    soup = BeautifulSoup(html, "html.parser")
+    soup = _parse_html(html)
     selector = source.article_selector or "article a, h2 a, h3 a, li a"
-    compiled_pattern = re.compile(source.link_pattern) if source.link_pattern else None
+    compiled_pattern = source.link_re
 
-    def _pick_nearest_date_elem(container, anchor):
-        if not source.date_selector:
-            return None
+    # 同一容器下的多个链接共享日期候选与节点序号索引，每个容器只计算一次。
+    container_index_cache: dict[int, tuple[list, dict[int, int]]] = {}
+
+    def _container_date_index(container) -> tuple[list, dict[int, int]]:
+        cached = container_index_cache.get(id(container))
+        if cached is not None:
+            return cached
         try:
             candidates = list(container.select(source.date_selector))
         except Exception:  # noqa: BLE001
+            candidates = []
+        index_by_id: dict[int, int] = {}
+        if len(candidates) > 1:
+            ordered_nodes = [node for node in container.descendants if getattr(node, "name", None)]
+            index_by_id = {id(node): idx for idx, node in enumerate(ordered_nodes)}
+        container_index_cache[id(container)] = (candidates, index_by_id)
+        return candidates, index_by_id
+
+    def _pick_nearest_date_elem(container, anchor):
+        if not source.date_selector:
             return None
+        candidates, index_by_id = _container_date_index(container)
         if not candidates:
             return None
         if len(candidates) == 1:
             return candidates[0]
 
-        ordered_nodes = [node for node in container.descendants if getattr(node, "name", None)]
-        if not ordered_nodes:
-            return candidates[0]
-        index_by_id = {id(node): idx for idx, node in enumerate(ordered_nodes)}
         anchor_idx = index_by_id.get(id(anchor))
         if anchor_idx is None:
             return candidates[0]
@@ -621,7 +1044,7 @@ def _extract_page_links(
         lowered_text = text.strip().lower()
         if len(text.strip()) < 8:
             return None
-        if any(noise in lowered_text for noise in _NOISE_TITLE_WORDS):
+        if _NOISE_TITLE_PATTERN.search(lowered_text):
             return None
         if lowered_text.endswith("app"):
             return None
@@ -646,7 +1069,7 @@ def _extract_page_links(
             date_elem = _pick_nearest_date_elem(container, a)
             if date_elem:
                 published = _extract_date_from_element(
-                    date_elem, source.date_attr, source.date_regex, ref_time
+                    date_elem, source.date_attr, source.date_re, ref_time
                 )
         if not published:
             published = _extract_nearby_date(a, ref_time)
@@ -662,14 +1085,21 @@ def _extract_page_links(
         return
 
     if source.date_selector:
+        # 日期节点只查询一次，记录其所有祖先；向上查找容器时改为集合成员判断。
+        date_ancestor_ids: set[int] = set()
+        for date_node in soup.select(source.date_selector):
+            for parent in date_node.parents:
+                parent_id = id(parent)
+                if parent_id in date_ancestor_ids:
+                    break
+                date_ancestor_ids.add(parent_id)
         for a in soup.select(selector):
             container = a.parent
             depth = 0
             while container and container.name and depth < 8:
                 if container.name in {"body", "html"}:
                     break
-                date_elem = container.select_one(source.date_selector)
-                if date_elem:
+                if id(container) in date_ancestor_ids:
                     break
                 container = container.parent if hasattr(container, "parent") else None
                 depth += 1
@@ -684,70 +1114,201 @@ def _extract_page_links(
             yield result
 
 
+def _resolve_html_item(
+    source: SourceConfig,
+    client: httpx.Client,
+    link: tuple[str, str, Optional[datetime], str, str],
+    ref_time: datetime,
+) -> tuple[str, Optional[datetime], str]:
+    """还原单条链接并按需回源文章页，返回 (final_url, published_at, publisher)。"""
+    title, url, published, context_text, _ = link
+    final_url = _resolve_item_url(source, client, url)
+    # 文章页按需抓取并只解析一次，发布时间与发布方提取共用同一棵树。
+    article_soup: BeautifulSoup | None = None
+    article_fetched = False
+    if not published:
+        published = _lookup_article_date(final_url)
+        if published is None:
+            article_soup = _fetch_article_soup(client, final_url)
+            article_fetched = True
+            if article_soup is not None:
+                published = _extract_article_published_at(article_soup, ref_time)
+                # 只缓存解析出的日期，抓取失败或无日期的页面下轮仍会重试
+                _remember_article_date(final_url, published)
+    if not published:
+        return final_url, None, ""
+
+    publisher = ""
+    if source.split_source_by_publisher:
+        publisher = _extract_publisher_from_text(f"{title} {context_text}")
+        if not publisher:
+            if not article_fetched:
+                article_soup = _fetch_article_soup(client, final_url)
+            if article_soup is not None:
+                publisher = _extract_article_publisher(article_soup)
+    return final_url, published, publisher
+
+
 def _collect_html(source: SourceConfig, client: httpx.Client) -> list[RawItem]:
-    resp = client.get(source.url)
+    resp, html, cached_items = _conditional_get(client, source, read_html=True)
+    if cached_items is not None:
+        logger.info("Source not modified, reuse cached items: %s", source.name)
+        return cached_items
     resp.raise_for_status()
     now = datetime.now(timezone.utc)
 
-    items: list[RawItem] = []
-    seen_urls: set[str] = set()
-    for title, url, published, context_text, author in _extract_page_links(source, resp.text, now):
+    links: list[tuple[str, str, Optional[datetime], str, str]] = []
+    for link in _extract_page_links(source, html, now):
+        title, url, _, context_text, author = link
         if not _matches_required_keywords(source, title, context_text, author, url):
             logger.debug("Drop html item not matching source keywords: %s | %s", source.name, title)
             continue
         if not _matches_required_author_keywords(source, author):
             logger.debug("Drop html item not matching author keywords: %s | %s | author=%s", source.name, title, author)
             continue
+        links.append(link)
 
-        final_url = _resolve_item_url(source, client, url)
-        if final_url in seen_urls:
-            continue
-        seen_urls.add(final_url)
-        if not published:
-            published = _fetch_article_published_at(client, final_url, now)
-        if not published:
-            logger.debug("Drop html item without published_at: %s | %s", source.name, final_url)
-            continue
+    items: list[RawItem] = []
+    seen_urls: set[str] = set()
+    complete = True
+    pos = 0
+    # 跳转还原与文章页回源是网络 IO，按窗口并发执行；窗口大小取剩余名额，避免多抓无用页面。
+    with ThreadPoolExecutor(max_workers=_DETAIL_FETCH_WORKERS) as executor:
+        while pos < len(links) and len(items) < _MAX_HTML_ITEMS:
+            window = links[pos : pos + _MAX_HTML_ITEMS - len(items)]
+            pos += len(window)
+            results = executor.map(lambda link: _resolve_html_item(source, client, link, now), window)
+            for (title, _, _, context_text, _), (final_url, published, publisher) in zip(window, results):
+                if final_url in seen_urls:
+                    continue
+                seen_urls.add(final_url)
+                if not published:
+                    logger.debug("Drop html item without published_at: %s | %s", source.name, final_url)
+                    complete = False
+                    continue
+
+                source_name = f"{source.name}/{publisher}" if publisher else source.name
+                items.append(
+                    RawItem(
+                        source_name=source_name,
+                        source_weight=source.weight,
+                        url=final_url,
+                        title=title,
+                        content=context_text,
+                        published_at=published,
+                        discovered_at=now,
+                        tags=source.tags,
+                    )
+                )
+                if len(items) >= _MAX_HTML_ITEMS:
+                    break
+    _remember_conditional(source, resp, items, complete)
+    return items
 
-        source_name = source.name
-        if source.split_source_by_publisher:
-            publisher = _extract_publisher_from_text(f"{title} {context_text}")
-            if not publisher:
-                publisher = _fetch_article_publisher(client, final_url)
-            if publisher:
-                source_name = f"{source.name}/{publisher}"
 
-        items.append(
-            RawItem(
-                source_name=source_name,
-                source_weight=source.weight,
-                url=final_url,
-                title=title,
-                content=context_text,
-                published_at=published,
-                discovered_at=now,
-                tags=source.tags,
-            )
-        )
-        if len(items) >= 30:
-            break
-    return items
+class _HostLimitedClient:
+    """按请求 URL 的主机限流的 httpx.Client 包装：列表页、跳转还原与文章页回源共用同一主机配额。"""
+
+    def __init__(self, client: httpx.Client, max_per_host: int) -> None:
+        self._client = client
+        self._max_per_host = max_per_host
+        self._slots: dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+
+    def _slot(self, url) -> threading.BoundedSemaphore:
+        host = urlsplit(str(url)).netloc.lower()
+        with self._lock:
+            slot = self._slots.get(host)
+            if slot is None:
+                slot = self._slots[host] = threading.BoundedSemaphore(self._max_per_host)
+            return slot
+
+    def get(self, url, **kwargs):
+        with self._slot(url):
+            return self._client.get(url, **kwargs)
+
+    @contextmanager
+    def stream(self, method: str, url, **kwargs):
+        with self._slot(url), self._client.stream(method, url, **kwargs) as resp:
+            yield resp
+
+    def __getattr__(self, name: str):
+        return getattr(self._client, name)
+
+
+def _build_client(timeout_seconds: int, proxy: str | None, max_connections: int = 64) -> httpx.Client:
+    # 安装 httpx[http2] 时启用 HTTP/2 多路复用；压缩编码由 httpx 按已安装的解码器自动协商。
+    # 连接池等待不设超时：单个请求已受连接/读取超时约束，排队的请求不应因池满被 PoolTimeout 丢弃。
+    client_kwargs: dict = {
+        "timeout": httpx.Timeout(timeout_seconds, pool=None),
+        "follow_redirects": True,
+        "http2": _HTTP2_ENABLED,
+        "limits": httpx.Limits(max_keepalive_connections=32, max_connections=max_connections),
+    }
+    if proxy and proxy.strip():
+        client_kwargs["proxy"] = proxy.strip()
+    return httpx.Client(**client_kwargs)
+
+
+def _collect_with_client(source: SourceConfig, client: httpx.Client) -> list[RawItem]:
+    logger.info("Collecting source: %s", source.name)
+    if source.type == "rss":
+        return _collect_rss(source, client)
+    if source.type == "html":
+        return _collect_html(source, client)
+    if source.type == "wechat_profile":
+        return _collect_wechat_profile(source, client)
+    raise ValueError(f"Unsupported source type: {source.type}")
 
 
 def collect_from_source(
     source: SourceConfig,
     timeout_seconds: int = 15,
     proxy: str | None = None,
+    client: httpx.Client | None = None,
 ) -> list[RawItem]:
-    logger.info("Collecting source: %s", source.name)
-    client_kwargs: dict = {"timeout": timeout_seconds, "follow_redirects": True}
-    if proxy and proxy.strip():
-        client_kwargs["proxy"] = proxy.strip()
-    with httpx.Client(**client_kwargs) as client:
-        if source.type == "rss":
-            return _collect_rss(source, client)
-        if source.type == "html":
-            return _collect_html(source, client)
-        if source.type == "wechat_profile":
-            return _collect_wechat_profile(source, client)
-    raise ValueError(f"Unsupported source type: {source.type}")
+    """采集单个来源；传入 client 时复用调用方的连接池，否则临时创建。"""
+    if client is not None:
+        return _collect_with_client(source, client)
+    with _build_client(timeout_seconds, proxy) as owned_client:
+        return _collect_with_client(source, owned_client)
+
+
+def collect_from_sources(
+    sources: list[SourceConfig],
+    timeout_seconds: int = 15,
+    proxy: str | None = None,
+    max_workers: int = 32,
+    max_per_host: int = 4,
+) -> list[list[RawItem] | Exception]:
+    """并发采集多个来源，共用一个 httpx.Client 复用连接池。
+
+    返回顺序与 sources 一致；单个来源失败时对应位置为异常对象，不影响其他来源。
+    同一主机（如 weixin.sogou.com、RSSHub）同时最多 max_per_host 个在途请求（含文章页回源），避免触发反爬。
+    """
+    if not sources:
+        return []
+
+    def _run(index: int) -> list[RawItem] | Exception:
+        try:
+            return _collect_with_client(sources[index], limited_client)
+        except Exception as exc:  # noqa: BLE001
+            return exc
+
+    # 按主机轮转提交，避免同一主机的来源连续占满线程后在主机配额上空等
+    by_host: dict[str, list[int]] = {}
+    for index, source in enumerate(sources):
+        by_host.setdefault(urlsplit(source.url).netloc.lower(), []).append(index)
+    order = [index for group in zip_longest(*by_host.values()) for index in group if index is not None]
+
+    results: list[list[RawItem] | Exception] = [[] for _ in sources]
+    workers = min(max_workers, len(sources))
+    # 每个来源线程最多再并发 _DETAIL_FETCH_WORKERS 个回源请求，连接池按最坏并发取上限
+    max_connections = max(64, workers * _DETAIL_FETCH_WORKERS)
+    with _build_client(timeout_seconds, proxy, max_connections=max_connections) as client:
+        limited_client = _HostLimitedClient(client, max_per_host)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {index: executor.submit(_run, index) for index in order}
+            for index, future in futures.items():
+                results[index] = future.result()
+    return results
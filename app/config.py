@@ -10,10 +10,19 @@ import yaml
 from app.env_utils import load_local_env
 from app.models import Settings, SourceConfig
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # 未编译 libyaml 时回退纯 Python 实现
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
 _ENV_PATTERN = re.compile(r"\$\{([A-Z0-9_]+)(?::-([^}]*))?\}")
 
 
 def _resolve_env_string(value: str) -> str:
+    # 绝大多数配置值不含占位符，子串预检即可跳过正则替换
+    if "${" not in value:
+        return value
+
     def _replace(match: re.Match[str]) -> str:
         env_name = match.group(1)
         default = match.group(2)
@@ -37,7 +46,7 @@ def _resolve_env_value(value: Any) -> Any:
 
 def _load_yaml(path: str) -> dict[str, Any]:
     with open(path, "r", encoding="utf-8") as f:
-        data = yaml.safe_load(f) or {}
+        data = yaml.load(f, Loader=_YamlLoader) or {}
     return _resolve_env_value(data)
 
 
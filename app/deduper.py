@@ -2,27 +2,39 @@ from __future__ import annotations
 
 import hashlib
 import re
+from collections import defaultdict
 from difflib import SequenceMatcher
+from typing import Iterable
 
 from app.models import NormalizedItem
 
+# 空白字符都不属于 \w，一次非词字符替换即同时去掉空白
+_NON_WORD_PATTERN = re.compile(r"[^\w\u4e00-\u9fff]")
+
 
 def _content_fingerprint(content: str) -> str:
+    # 仅用于单次运行内的去重比对，不落盘；blake2b 在短输入上比 md5 更快
     payload = content[:800].strip().lower().encode("utf-8")
-    return hashlib.md5(payload).hexdigest()
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
 
 
 def _normalize_title(title: str) -> str:
     lowered = title.lower()
     lowered = lowered.replace("人工智能", "ai")
     lowered = lowered.replace("大模型", "模型")
-    lowered = re.sub(r"\s+", "", lowered)
-    lowered = re.sub(r"[^\w\u4e00-\u9fff]", "", lowered)
-    return lowered
+    return _NON_WORD_PATTERN.sub("", lowered)
 
 
-def _title_similarity(a: str, b: str) -> float:
-    return SequenceMatcher(None, _normalize_title(a), _normalize_title(b)).ratio()
+def _candidate_lengths(length: int, threshold: float, known_lengths: Iterable[int]) -> Iterable[int]:
+    """ratio = 2M/(la+lb) ≤ 2·min(la, lb)/(la+lb)，只有长度落在窗口内的标题才可能达到阈值。"""
+    if threshold <= 0:
+        return known_lengths
+    if threshold > 1:
+        return ()
+    # 窗口取整时略放宽，最终仍以精确 ratio 判定
+    low = int(threshold * length / (2 - threshold))
+    high = int((2 - threshold) * length / threshold) + 1
+    return range(low, high + 1)
 
 
 def dedupe_items(items: list[NormalizedItem], title_similarity_threshold: float = 0.92) -> list[NormalizedItem]:
@@ -32,26 +44,40 @@ def dedupe_items(items: list[NormalizedItem], title_similarity_threshold: float
     selected: list[NormalizedItem] = []
     seen_urls: set[str] = set()
     seen_fingerprints: set[str] = set()
+    # 已保留标题按归一化长度分桶，候选只与长度窗口内的桶比较；
+    # 每个已保留标题持有一个 set_seq2 过的 SequenceMatcher，其 b2j 索引只构建一次
+    kept_matchers_by_length: dict[int, list[SequenceMatcher]] = defaultdict(list)
 
     for item in sorted_items:
         if item.canonical_url in seen_urls:
             continue
 
-        fp = _content_fingerprint(item.content)
-        if item.content and fp in seen_fingerprints:
+        # 空正文不参与指纹去重，也就无需哈希
+        fp = _content_fingerprint(item.content) if item.content else ""
+        if fp and fp in seen_fingerprints:
             continue
 
+        norm_title = _normalize_title(item.title)
         duplicate_by_title = False
-        for kept in selected:
-            if _title_similarity(item.title, kept.title) >= title_similarity_threshold:
-                duplicate_by_title = True
+        for length in _candidate_lengths(len(norm_title), title_similarity_threshold, list(kept_matchers_by_length)):
+            for matcher in kept_matchers_by_length.get(length, ()):
+                matcher.set_seq1(norm_title)
+                # quick_ratio 按字符多重集给出 ratio 的上界，达不到阈值时跳过精确匹配
+                if (
+                    matcher.quick_ratio() >= title_similarity_threshold
+                    and matcher.ratio() >= title_similarity_threshold
+                ):
+                    duplicate_by_title = True
+                    break
+            if duplicate_by_title:
                 break
         if duplicate_by_title:
             continue
 
         selected.append(item)
         seen_urls.add(item.canonical_url)
-        if item.content:
+        kept_matchers_by_length[len(norm_title)].append(SequenceMatcher(None, "", norm_title))
+        if fp:
             seen_fingerprints.add(fp)
 
     return selected
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import os
+import stat
+from functools import lru_cache
 from pathlib import Path
 
 
@@ -22,6 +24,17 @@ def _parse_env_line(line: str) -> tuple[str, str] | None:
     return key, value
 
 
+@lru_cache(maxsize=16)
+def _parse_env_file(path_str: str, mtime_ns: int, size: int) -> tuple[tuple[str, str], ...]:
+    """按 (路径, mtime, 大小) 缓存解析结果，文件改动后自然失效。"""
+    pairs: list[tuple[str, str]] = []
+    for line in Path(path_str).read_text(encoding="utf-8").splitlines():
+        parsed = _parse_env_line(line)
+        if parsed:
+            pairs.append(parsed)
+    return tuple(pairs)
+
+
 def load_local_env(reference_path: str | None = None) -> None:
     candidates: list[Path] = []
 
@@ -41,12 +54,12 @@ def load_local_env(reference_path: str | None = None) -> None:
         if path in seen:
             continue
         seen.add(path)
-        if not path.exists() or not path.is_file():
+        try:
+            st = path.stat()
+        except OSError:
+            continue
+        if not stat.S_ISREG(st.st_mode):
             continue
-        for line in path.read_text(encoding="utf-8").splitlines():
-            parsed = _parse_env_line(line)
-            if not parsed:
-                continue
-            key, value = parsed
+        for key, value in _parse_env_file(str(path), st.st_mtime_ns, st.st_size):
             os.environ.setdefault(key, value)
 
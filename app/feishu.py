@@ -1,19 +1,26 @@
 from __future__ import annotations
 
+import atexit
 import json
 import logging
+import multiprocessing
+import os
 import re
 import sqlite3
 import threading
 import time
-from collections import OrderedDict
+from collections import OrderedDict, deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Callable
+from typing import Callable, NamedTuple
 
 import httpx
 from fastapi import BackgroundTasks
 
+from app.logging_utils import setup_logging
 from app.models import DailyBrief, Settings
 from app.publisher import render_markdown
 
@@ -21,12 +28,38 @@ logger = logging.getLogger(__name__)
 
 _MENTION_TAG_RE = re.compile(r"<at\b[^>]*>.*?</at>", re.IGNORECASE | re.DOTALL)
 
-_TOKEN_CACHE: dict[str, tuple[str, float]] = {}
+# (base_url|app_id) -> (token, 过期时刻)；过期时刻基于 time.monotonic，不受系统时钟跳变影响
+_TOKEN_CACHE: OrderedDict[str, tuple[str, float]] = OrderedDict()
 _TOKEN_CACHE_LOCK = threading.Lock()
+_TOKEN_CACHE_MAX = 64
+# 正在刷新的 token：同一 key 只有一个线程发起鉴权请求，其余线程等待同一个 Future
+_TOKEN_INFLIGHT: dict[str, Future[tuple[str, float]]] = {}
+_TOKEN_INFLIGHT_TIMEOUT = 15.0
+
+# 未显式传入 client 时共用的连接池，进程内首次发送时创建，退出时关闭
+_SHARED_CLIENT: httpx.Client | None = None
+_SHARED_CLIENT_LOCK = threading.Lock()
+
+# /run 流水线的独立进程池，首次 /run 时创建
+_PIPELINE_POOL: ProcessPoolExecutor | None = None
+_PIPELINE_POOL_LOCK = threading.Lock()
 
-_EVENT_CACHE: OrderedDict[str, None] = OrderedDict()
-_EVENT_CACHE_LOCK = threading.Lock()
 _EVENT_CACHE_MAX = 1000
+# 定长环形队列记录到达顺序，集合负责 O(1) 判重；满时淘汰最早的事件
+_EVENT_RING: deque[str] = deque(maxlen=_EVENT_CACHE_MAX)
+_EVENT_SET: set[str] = set()
+_EVENT_CACHE_LOCK = threading.Lock()
+
+# 指令词到命令的映射（首个词或整句命中均可）
+_COMMAND_TOKENS: dict[str, str] = {
+    **dict.fromkeys(("/run", "run", "运行日报", "执行日报", "生成日报"), "run"),
+    **dict.fromkeys(("/latest", "latest", "最新日报", "查看日报", "日报"), "latest"),
+    **dict.fromkeys(("/status", "status", "状态", "运行状态", "健康检查"), "status"),
+    **dict.fromkeys(("/help", "help", "帮助", "菜单", "命令"), "help"),
+}
+
+# 单槽缓存 ((归档路径, mtime_ns, size), /latest 摘要文本)；整体替换元组，读写无需加锁
+_LATEST_SUMMARY: tuple[tuple[str, int, int], str] | None = None
 
 _HELP_TEXT = (
     "可用命令（支持带/和不带/）：\n"
@@ -46,23 +79,13 @@ def _token_cache_key(app_id: str, base_url: str) -> str:
     return f"{base_url}|{app_id}"
 
 
-def _get_tenant_access_token(
+def _fetch_tenant_access_token(
     app_id: str,
     app_secret: str,
     base_url: str,
     client: httpx.Client,
-    now_fn: Callable[[], float] = time.time,
-) -> str:
-    now = now_fn()
-    cache_key = _token_cache_key(app_id, base_url)
-
-    with _TOKEN_CACHE_LOCK:
-        cached = _TOKEN_CACHE.get(cache_key)
-        if cached is not None:
-            token, expire_at = cached
-            if expire_at - now >= 60:
-                return token
-
+    now: float,
+) -> tuple[str, float]:
     resp = client.post(
         f"{base_url}/open-apis/auth/v3/tenant_access_token/internal",
         json={"app_id": app_id, "app_secret": app_secret},
@@ -79,9 +102,50 @@ def _get_tenant_access_token(
         raise RuntimeError("Feishu auth failed: missing tenant_access_token")
 
     expire_in = int(data.get("expire", 7200))
-    expire_at = now + max(300, expire_in - 120)
+    return token, now + max(300, expire_in - 120)
+
+
+def _get_tenant_access_token(
+    app_id: str,
+    app_secret: str,
+    base_url: str,
+    client: httpx.Client,
+    now_fn: Callable[[], float] = time.monotonic,
+) -> str:
+    now = now_fn()
+    cache_key = _token_cache_key(app_id, base_url)
+
+    with _TOKEN_CACHE_LOCK:
+        cached = _TOKEN_CACHE.get(cache_key)
+        if cached is not None:
+            token, expire_at = cached
+            if expire_at - now >= 60:
+                _TOKEN_CACHE.move_to_end(cache_key)
+                return token
+        inflight = _TOKEN_INFLIGHT.get(cache_key)
+        if inflight is None:
+            future: Future[tuple[str, float]] = Future()
+            _TOKEN_INFLIGHT[cache_key] = future
+
+    # 已有线程在刷新同一 token 时直接等待其结果，刷新失败时异常同样抛给等待方
+    if inflight is not None:
+        return inflight.result(timeout=_TOKEN_INFLIGHT_TIMEOUT)[0]
+
+    try:
+        token, expire_at = _fetch_tenant_access_token(app_id, app_secret, base_url, client, now)
+    except BaseException as exc:
+        with _TOKEN_CACHE_LOCK:
+            _TOKEN_INFLIGHT.pop(cache_key, None)
+        future.set_exception(exc)
+        raise
+
     with _TOKEN_CACHE_LOCK:
         _TOKEN_CACHE[cache_key] = (token, expire_at)
+        _TOKEN_CACHE.move_to_end(cache_key)
+        while len(_TOKEN_CACHE) > _TOKEN_CACHE_MAX:
+            _TOKEN_CACHE.popitem(last=False)
+        _TOKEN_INFLIGHT.pop(cache_key, None)
+    future.set_result((token, expire_at))
     return token
 
 
@@ -91,6 +155,15 @@ def _clear_tenant_access_token_cache(app_id: str, base_url: str) -> None:
         _TOKEN_CACHE.pop(cache_key, None)
 
 
+def _shared_client() -> httpx.Client:
+    global _SHARED_CLIENT
+    with _SHARED_CLIENT_LOCK:
+        if _SHARED_CLIENT is None:
+            _SHARED_CLIENT = httpx.Client(timeout=15, limits=httpx.Limits(max_keepalive_connections=8))
+            atexit.register(_SHARED_CLIENT.close)
+        return _SHARED_CLIENT
+
+
 def push_feishu_text(
     app_id: str,
     app_secret: str,
@@ -107,29 +180,24 @@ def push_feishu_text(
     if not receive_id:
         raise ValueError("Missing Feishu receive_id")
 
-    owned_client = client is None
-    if owned_client:
-        client = httpx.Client(timeout=15)
+    if client is None:
+        client = _shared_client()
 
     attempts = (0,) + retries
-    try:
-        for wait_seconds in attempts:
-            if wait_seconds > 0:
-                sleep_fn(wait_seconds)
-            if _send_feishu_text_once(
-                app_id=app_id,
-                app_secret=app_secret,
-                base_url=base_url,
-                receive_id=receive_id,
-                receive_id_type=receive_id_type,
-                content=content,
-                client=client,
-            ):
-                return True
-        return False
-    finally:
-        if owned_client and client is not None:
-            client.close()
+    for wait_seconds in attempts:
+        if wait_seconds > 0:
+            sleep_fn(wait_seconds)
+        if _send_feishu_text_once(
+            app_id=app_id,
+            app_secret=app_secret,
+            base_url=base_url,
+            receive_id=receive_id,
+            receive_id_type=receive_id_type,
+            content=content,
+            client=client,
+        ):
+            return True
+    return False
 
 
 def _send_feishu_text_once(
@@ -247,27 +315,9 @@ def _resolve_command(text: str) -> str | None:
     normalized = text.strip().lower()
     token = normalized.split()[0] if normalized else ""
 
-    run_tokens = {"/run", "run", "运行日报", "执行日报", "生成日报"}
-    latest_tokens = {"/latest", "latest", "最新日报", "查看日报", "日报"}
-    status_tokens = {"/status", "status", "状态", "运行状态", "健康检查"}
-    help_tokens = {"/help", "help", "帮助", "菜单", "命令"}
-
-    if token in run_tokens:
-        return "run"
-    if token in latest_tokens:
-        return "latest"
-    if token in status_tokens:
-        return "status"
-    if token in help_tokens:
-        return "help"
-    if normalized in run_tokens:
-        return "run"
-    if normalized in latest_tokens:
-        return "latest"
-    if normalized in status_tokens:
-        return "status"
-    if normalized in help_tokens:
-        return "help"
+    command = _COMMAND_TOKENS.get(token) or _COMMAND_TOKENS.get(normalized)
+    if command:
+        return command
     if token.startswith("/"):
         return "help"
     return None
@@ -280,18 +330,22 @@ def split_text_for_feishu(content: str, max_chars: int = 3000) -> list[str]:
     if len(text) <= max_chars:
         return [text]
 
+    # 游标推进，不反复切出剩余尾部的副本
     chunks: list[str] = []
-    remaining = text
-    while len(remaining) > max_chars:
-        split_at = remaining.rfind("\n", 0, max_chars)
+    total = len(text)
+    start = 0
+    while total - start > max_chars:
+        split_at = text.rfind("\n", start, start + max_chars) - start
         if split_at < max_chars // 3:
             split_at = max_chars
-        chunk = remaining[:split_at].strip()
+        chunk = text[start : start + split_at].strip()
         if chunk:
             chunks.append(chunk)
-        remaining = remaining[split_at:].strip()
-    if remaining:
-        chunks.append(remaining)
+        start += split_at
+        while start < total and text[start].isspace():
+            start += 1
+    if start < total:
+        chunks.append(text[start:])
     return chunks
 
 
@@ -299,33 +353,59 @@ def _seen_event(event_id: str) -> bool:
     if not event_id:
         return False
     with _EVENT_CACHE_LOCK:
-        if event_id in _EVENT_CACHE:
+        if event_id in _EVENT_SET:
             return True
-        _EVENT_CACHE[event_id] = None
-        while len(_EVENT_CACHE) > _EVENT_CACHE_MAX:
-            _EVENT_CACHE.popitem(last=False)
+        if len(_EVENT_RING) == _EVENT_CACHE_MAX:
+            _EVENT_SET.discard(_EVENT_RING[0])
+        _EVENT_RING.append(event_id)
+        _EVENT_SET.add(event_id)
     return False
 
 
+def _latest_archive(archives_dir: str) -> Path | None:
+    """单次 scandir 取文件名最大的 JSON 归档（归档按日期命名），无需排序全部文件。"""
+    try:
+        with os.scandir(archives_dir) as entries:
+            latest_name = max((entry.name for entry in entries if entry.name.endswith(".json")), default=None)
+    except FileNotFoundError:
+        return None
+    return Path(archives_dir) / latest_name if latest_name else None
+
+
 def _format_latest_summary(archives_dir: str) -> str:
-    files = sorted(Path(archives_dir).glob("*.json"), reverse=True)
-    if not files:
+    global _LATEST_SUMMARY
+    latest_file = _latest_archive(archives_dir)
+    if latest_file is None:
         return "还没有归档记录，请先执行 /run。"
 
-    latest_file = files[0]
+    stat = latest_file.stat()
+    cache_key = (str(latest_file), stat.st_mtime_ns, stat.st_size)
+    cached = _LATEST_SUMMARY
+    if cached is not None and cached[0] == cache_key:
+        return cached[1]
+
     payload = json.loads(latest_file.read_text(encoding="utf-8"))
     items = payload.get("items", [])
     title = payload.get("title", latest_file.stem)
     lines = [f"最近一次归档：{title}", f"条目数：{len(items)}"]
     for idx, item in enumerate(items[:3], start=1):
         lines.append(f"{idx}. {item.get('title', '未命名')}")
-    return "\n".join(lines)
+    summary = "\n".join(lines)
+    # 只保留最新一份归档的摘要；文件被改写后 mtime/size 变化即自动失效
+    _LATEST_SUMMARY = (cache_key, summary)
+    return summary
+
+
+@lru_cache(maxsize=1)
+def _now_iso(epoch_second: int) -> str:
+    """按秒缓存的 UTC 时间字符串，同一秒内的 /status 复用同一结果。"""
+    return datetime.fromtimestamp(epoch_second, timezone.utc).isoformat()
 
 
 def _format_status_summary(settings: Settings) -> str:
     db_path = Path(settings.db_path)
-    latest_archive = sorted(Path(settings.archives_dir).glob("*.json"), reverse=True)
-    archive_name = latest_archive[0].name if latest_archive else "无"
+    latest_archive = _latest_archive(settings.archives_dir)
+    archive_name = latest_archive.name if latest_archive else "无"
 
     run_status = "无运行记录"
     if db_path.exists():
@@ -340,7 +420,7 @@ def _format_status_summary(settings: Settings) -> str:
                 if row[2]:
                     run_status += f" | error={row[2][:120]}"
 
-    now = datetime.now(timezone.utc).isoformat()
+    now = _now_iso(int(time.time()))
     return (
         f"服务状态：ok\n"
         f"当前时间(UTC)：{now}\n"
@@ -398,6 +478,47 @@ def _send_reply(
     return False
 
 
+def _build_brief_markdown(run_pipeline_fn: Callable[..., DailyBrief]) -> tuple[DailyBrief, str]:
+    brief = run_pipeline_fn(push=False)
+    return brief, render_markdown(brief)
+
+
+def _pipeline_pool(log_level: str) -> ProcessPoolExecutor:
+    global _PIPELINE_POOL
+    with _PIPELINE_POOL_LOCK:
+        if _PIPELINE_POOL is None:
+            # spawn 避免在已有 WS/HTTP 线程的进程里 fork
+            _PIPELINE_POOL = ProcessPoolExecutor(
+                max_workers=1,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=setup_logging,
+                initargs=(log_level,),
+            )
+            atexit.register(_PIPELINE_POOL.shutdown, wait=False, cancel_futures=True)
+        return _PIPELINE_POOL
+
+
+def _run_pipeline_for_reply(
+    settings: Settings,
+    run_pipeline_fn: Callable[..., DailyBrief],
+    executor: Executor | None = None,
+) -> tuple[DailyBrief, str]:
+    """流水线放到执行器中运行，默认使用独立进程池，避免与 WS 事件线程争抢 GIL。"""
+    global _PIPELINE_POOL
+    if executor is not None:
+        return executor.submit(_build_brief_markdown, run_pipeline_fn).result()
+
+    pool = _pipeline_pool(settings.log_level)
+    try:
+        return pool.submit(_build_brief_markdown, run_pipeline_fn).result()
+    except BrokenProcessPool:
+        # 子进程异常退出后丢弃进程池，下次 /run 重新创建
+        with _PIPELINE_POOL_LOCK:
+            if _PIPELINE_POOL is pool:
+                _PIPELINE_POOL = None
+        raise
+
+
 def _run_pipeline_and_reply(
     settings: Settings,
     chat_id: str,
@@ -405,10 +526,10 @@ def _run_pipeline_and_reply(
     chat_type: str,
     send_text_fn: Callable[..., bool],
     run_pipeline_fn: Callable[..., DailyBrief],
+    pipeline_executor: Executor | None = None,
 ) -> None:
     try:
-        brief = run_pipeline_fn(push=False)
-        markdown_content = render_markdown(brief)
+        brief, markdown_content = _run_pipeline_for_reply(settings, run_pipeline_fn, pipeline_executor)
         chunks = split_text_for_feishu(markdown_content)
         if not chunks:
             chunks = [f"执行完成：{brief.title}（无可用内容）"]
@@ -435,13 +556,78 @@ def _run_pipeline_and_reply(
         )
 
 
+class _CommandContext(NamedTuple):
+    """单条指令消息的处理上下文，各指令处理函数按需取用。"""
+
+    settings: Settings
+    chat_id: str
+    sender_id: str
+    chat_type: str
+    send_text_fn: Callable[..., bool]
+    background_tasks: BackgroundTasks
+    run_pipeline_fn: Callable[..., DailyBrief]
+    pipeline_executor: Executor | None
+
+
+def _reply(ctx: _CommandContext, text: str) -> None:
+    _send_reply(
+        ctx.settings,
+        ctx.chat_id,
+        text,
+        sender_open_id=ctx.sender_id,
+        chat_type=ctx.chat_type,
+        send_text_fn=ctx.send_text_fn,
+    )
+
+
+def _handle_help(ctx: _CommandContext) -> dict:
+    _reply(ctx, _HELP_TEXT)
+    return {"ok": True}
+
+
+def _handle_latest(ctx: _CommandContext) -> dict:
+    _reply(ctx, _format_latest_summary(ctx.settings.archives_dir))
+    return {"ok": True}
+
+
+def _handle_status(ctx: _CommandContext) -> dict:
+    _reply(ctx, _format_status_summary(ctx.settings) + f"\n当前会话ID：{ctx.chat_id}")
+    return {"ok": True}
+
+
+def _handle_run(ctx: _CommandContext) -> dict:
+    _reply(ctx, "已收到 /run，开始执行，请稍候。")
+    ctx.background_tasks.add_task(
+        _run_pipeline_and_reply,
+        ctx.settings,
+        ctx.chat_id,
+        ctx.sender_id,
+        ctx.chat_type,
+        ctx.send_text_fn,
+        ctx.run_pipeline_fn,
+        ctx.pipeline_executor,
+    )
+    return {"ok": True}
+
+
+# 指令名 -> 处理函数；键集合与 _COMMAND_TOKENS 的取值一致
+_COMMAND_HANDLERS: dict[str, Callable[[_CommandContext], dict]] = {
+    "help": _handle_help,
+    "latest": _handle_latest,
+    "status": _handle_status,
+    "run": _handle_run,
+}
+
+
 def handle_feishu_event(
     payload: dict,
     settings: Settings,
     background_tasks: BackgroundTasks,
     send_text_fn: Callable[..., bool] = push_feishu_text,
     run_pipeline_fn: Callable[..., DailyBrief] | None = None,
+    pipeline_executor: Executor | None = None,
 ) -> dict:
+    """处理飞书事件回调；pipeline_executor 为空时 /run 在独立进程池中执行流水线。"""
     if run_pipeline_fn is None:
         from app.pipeline import run_daily_pipeline
 
@@ -510,58 +696,14 @@ def handle_feishu_event(
         command,
     )
 
-    if command == "help":
-        _send_reply(
-            settings,
-            chat_id,
-            _HELP_TEXT,
-            sender_open_id=sender_id,
-            chat_type=chat_type,
-            send_text_fn=send_text_fn,
-        )
-        return {"ok": True}
-
-    if command == "latest":
-        _send_reply(
-            settings,
-            chat_id,
-            _format_latest_summary(settings.archives_dir),
-            sender_open_id=sender_id,
-            chat_type=chat_type,
-            send_text_fn=send_text_fn,
-        )
-        return {"ok": True}
-
-    if command == "status":
-        status_text = _format_status_summary(settings) + f"\n当前会话ID：{chat_id}"
-        _send_reply(
-            settings,
-            chat_id,
-            status_text,
-            sender_open_id=sender_id,
-            chat_type=chat_type,
-            send_text_fn=send_text_fn,
-        )
-        return {"ok": True}
-
-    if command == "run":
-        _send_reply(
-            settings,
-            chat_id,
-            "已收到 /run，开始执行，请稍候。",
-            sender_open_id=sender_id,
-            chat_type=chat_type,
-            send_text_fn=send_text_fn,
-        )
-        background_tasks.add_task(
-            _run_pipeline_and_reply,
-            settings,
-            chat_id,
-            sender_id,
-            chat_type,
-            send_text_fn,
-            run_pipeline_fn,
-        )
-        return {"ok": True}
-
-    return {"ok": True}
+    ctx = _CommandContext(
+        settings,
+        chat_id,
+        sender_id,
+        chat_type,
+        send_text_fn,
+        background_tasks,
+        run_pipeline_fn,
+        pipeline_executor,
+    )
+    return _COMMAND_HANDLERS[command](ctx)
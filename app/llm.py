@@ -1,15 +1,35 @@
 from __future__ import annotations
 
+import atexit
+import functools
+import hashlib
 import json
 import logging
-from typing import Any, Optional, Protocol
+import re
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Optional, Protocol
 
-from openai import OpenAI
+import httpx
+from openai import DefaultHttpxClient, OpenAI
 
-from app.models import Perspective
+from app.models import DEFAULT_LLM_MAX_RETRIES, Perspective
+from app.storage import StateStore
+
+try:
+    import h2  # noqa: F401
+
+    _HTTP2_ENABLED = True
+except ImportError:
+    _HTTP2_ENABLED = False
 
 logger = logging.getLogger(__name__)
 
+# OpenAI / 火山方舟客户端共用的连接池，并发摘要时复用 TLS 连接；首次创建客户端时初始化，退出时关闭
+_SHARED_HTTP_CLIENT: httpx.Client | None = None
+_SHARED_HTTP_CLIENT_LOCK = threading.Lock()
+
 
 class LLMClient(Protocol):
     def classify_perspective(self, title: str, content: str) -> Optional[Perspective]: ...
@@ -30,39 +50,50 @@ class LLMClient(Protocol):
     def compose_observations(self, snippets: list[str]) -> list[str]: ...
 
 
-def _extract_response_text(response: Any) -> str:
-    output_text = getattr(response, "output_text", None)
-    if output_text:
-        return str(output_text).strip()
+def _extract_texts_from_obj(output: Any) -> list[str]:
+    texts: list[str] = []
+    for item in output or ():
+        for part in getattr(item, "content", None) or ():
+            if getattr(part, "type", None) in ("output_text", "text"):
+                text = getattr(part, "text", None)
+                if text:
+                    texts.append(str(text).strip())
+    return texts
+
 
+def _extract_texts_from_dict(output: Any) -> list[str]:
+    texts: list[str] = []
+    for item in output or ():
+        for part in item.get("content") or ():
+            if part.get("type") in ("output_text", "text"):
+                text = part.get("text")
+                if text:
+                    texts.append(str(text).strip())
+    return texts
+
+
+def _extract_response_text(response: Any) -> str:
+    # SDK 返回的是属性对象，测试与原始 JSON 是嵌套 dict；只在顶层判断一次，内层循环不再逐层双路探测
     if isinstance(response, dict):
         output_text = response.get("output_text")
         if output_text:
             return str(output_text).strip()
+        texts = _extract_texts_from_dict(response.get("output"))
+    else:
+        output_text = getattr(response, "output_text", None)
+        if output_text:
+            return str(output_text).strip()
+        texts = _extract_texts_from_obj(getattr(response, "output", None))
 
-    output = getattr(response, "output", None)
-    if output is None and isinstance(response, dict):
-        output = response.get("output", [])
-
-    texts: list[str] = []
-    for item in output or []:
-        content = getattr(item, "content", None)
-        if content is None and isinstance(item, dict):
-            content = item.get("content", [])
-
-        for part in content or []:
-            part_type = getattr(part, "type", None)
-            if part_type is None and isinstance(part, dict):
-                part_type = part.get("type")
+    return "\n".join([t for t in texts if t]).strip()
 
-            if part_type in ("output_text", "text"):
-                text = getattr(part, "text", None)
-                if text is None and isinstance(part, dict):
-                    text = part.get("text")
-                if text:
-                    texts.append(str(text).strip())
 
-    return "\n".join([t for t in texts if t]).strip()
+def _load_json_dict(candidate: str) -> dict[str, Any] | None:
+    try:
+        data = json.loads(candidate)
+    except json.JSONDecodeError:
+        return None
+    return data if isinstance(data, dict) else None
 
 
 def _safe_load_json(raw: str) -> dict[str, Any] | None:
@@ -70,36 +101,37 @@ def _safe_load_json(raw: str) -> dict[str, Any] | None:
     if not text:
         return None
 
-    candidates = [text]
-    if "```" in text:
-        for segment in text.split("```"):
-            cleaned = segment.strip()
-            if not cleaned:
-                continue
-            if cleaned.lower().startswith("json"):
-                cleaned = cleaned[4:].strip()
-            candidates.append(cleaned)
-
-    for candidate in candidates:
-        try:
-            data = json.loads(candidate)
-            if isinstance(data, dict):
-                return data
-        except json.JSONDecodeError:
+    # 常见情况是模型直接返回纯 JSON，整体解析成功即返回，不再切分代码块
+    data = _load_json_dict(text)
+    if data is not None or "```" not in text:
+        return data
+
+    for segment in text.split("```"):
+        cleaned = segment.strip()
+        if not cleaned:
             continue
+        if cleaned[:4].lower() == "json":
+            cleaned = cleaned[4:].strip()
+        data = _load_json_dict(cleaned)
+        if data is not None:
+            return data
 
     return None
 
 
+# 兜底摘要中命中任一关键词即视为高重要度；关键词不含空格，分别扫描标题与正文与拼接后扫描等价
+_HIGH_IMPORTANCE_PATTERN = re.compile("发布|开源|融资|突破|重磅|首个")
+
+# 模型可能返回的重要度写法 -> 规范值
+_IMPORTANCE_ALIASES: dict[str, str] = {
+    **dict.fromkeys(("high", "h", "重要", "高", "high_priority"), "high"),
+    **dict.fromkeys(("low", "l", "低", "次要", "参考"), "low"),
+    **dict.fromkeys(("medium", "m", "中", "关注"), "medium"),
+}
+
+
 def _normalize_importance(value: Any, fallback: str = "medium") -> str:
-    raw = str(value or "").strip().lower()
-    if raw in {"high", "h", "重要", "高", "high_priority"}:
-        return "high"
-    if raw in {"low", "l", "低", "次要", "参考"}:
-        return "low"
-    if raw in {"medium", "m", "中", "关注"}:
-        return "medium"
-    return fallback
+    return _IMPORTANCE_ALIASES.get(str(value or "").strip().lower(), fallback)
 
 
 def _build_fallback_summary(
@@ -116,7 +148,7 @@ def _build_fallback_summary(
     perspective_text = perspective.value if perspective is not None else "综合"
 
     importance = "medium"
-    if any(keyword in f"{title} {content}" for keyword in ("发布", "开源", "融资", "突破", "重磅", "首个")):
+    if _HIGH_IMPORTANCE_PATTERN.search(title) or _HIGH_IMPORTANCE_PATTERN.search(content):
         importance = "high"
 
     return {
@@ -143,7 +175,7 @@ def _normalize_summary_payload(
     data = payload or {}
 
     points_raw = data.get("points", [])
-    points = [str(p).strip() for p in points_raw if str(p).strip()] if isinstance(points_raw, list) else []
+    points = [text for p in points_raw if (text := str(p).strip())] if isinstance(points_raw, list) else []
     if not points:
         points = fallback["points"]
 
@@ -159,6 +191,156 @@ def _normalize_summary_payload(
     }
 
 
+def _summary_from_raw_text(
+    raw: str,
+    title: str,
+    content: str,
+    source_name: str,
+    url: str,
+    perspective: Optional[Perspective] = None,
+) -> dict[str, Any]:
+    """模型回复不是 JSON 时，以回复开头作为首条要点，其余字段直接取兜底摘要，无需再走归一化。"""
+    summary = _build_fallback_summary(title, content, source_name, url, perspective)
+    summary["points"] = [p for p in (raw[:120].strip(), "建议阅读原文确认关键细节。") if p]
+    return summary
+
+
+def _shared_http_client() -> httpx.Client:
+    global _SHARED_HTTP_CLIENT
+    with _SHARED_HTTP_CLIENT_LOCK:
+        if _SHARED_HTTP_CLIENT is None:
+            # 沿用 SDK 默认超时与跟随重定向行为；并发上限与采集端一致
+            _SHARED_HTTP_CLIENT = DefaultHttpxClient(
+                http2=_HTTP2_ENABLED,
+                limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+            )
+            atexit.register(_SHARED_HTTP_CLIENT.close)
+        return _SHARED_HTTP_CLIENT
+
+
+class _TokenBucket:
+    """线程安全的令牌桶：按每分钟请求数匀速放行，最多积攒 1 秒的突发量。"""
+
+    def __init__(
+        self,
+        rate_per_minute: int,
+        now_fn: Callable[[], float] = time.monotonic,
+        sleep_fn: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.rate_per_second = rate_per_minute / 60.0
+        self.capacity = max(1.0, self.rate_per_second)
+        self.tokens = self.capacity
+        self.now_fn = now_fn
+        self.sleep_fn = sleep_fn
+        self.updated_at = now_fn()
+        self.lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self.lock:
+                now = self.now_fn()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate_per_second)
+                self.updated_at = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate_per_second
+            self.sleep_fn(wait)
+
+
+def _cached_llm(func: Callable[[Any, str, str], str]) -> Callable[[Any, str, str], str]:
+    """按 (模型, 系统提示, 用户提示) 的 blake2b 摘要缓存非空回复；客户端未配置 cache 时直接调用。
+
+    只用于逐条的分类/摘要调用；导语与观察依赖当天全部条目，每次重新生成，不走缓存。
+    """
+
+    @functools.wraps(func)
+    def wrapper(self: Any, system_prompt: str, user_prompt: str) -> str:
+        cache: StateStore | None = getattr(self, "cache", None)
+        if cache is None:
+            return func(self, system_prompt, user_prompt)
+
+        payload = f"{self.model}\x00{system_prompt}\x00{user_prompt}".encode("utf-8")
+        cache_key = hashlib.blake2b(payload, digest_size=16).hexdigest()
+        # 缓存读写失败（如并发写入时 database is locked）只记日志，不影响真实请求与已得到的回复
+        try:
+            cached = cache.get_llm_response(cache_key, ttl_hours=self.cache_ttl_hours)
+        except sqlite3.Error as exc:
+            logger.warning("LLM cache read failed: %s", exc)
+            cached = None
+        if cached is not None:
+            return cached
+
+        text = func(self, system_prompt, user_prompt)
+        if text:
+            try:
+                cache.put_llm_response(cache_key, text)
+            except sqlite3.Error as exc:
+                logger.warning("LLM cache write failed: %s", exc)
+        return text
+
+    return wrapper
+
+
+_SUMMARY_TMPL = (
+    "请将以下资讯总结为严格 JSON，不要输出任何额外文本。\n"
+    "返回格式："
+    "{{\"importance\":\"high|medium|low\","
+    "\"insight\":\"一句话给出价值点\","
+    "\"points\":[\"要点1\",\"要点2\"]}}\n"
+    "要求：\n"
+    "1) points 输出 2-4 条中文短句；\n"
+    "2) insight 合并意义与立场，给出价值点：可有一定前瞻性、可否定文章内容、可认可并延伸；不要中性复述；\n"
+    "3) importance 用 high/medium/low。\n"
+    "\n视角提示:{perspective_hint}\n标题:{title}\n来源:{source_name}\n链接:{url}\n内容:{content}"
+)
+_CLASSIFY_TMPL = "请只输出一个英文标签：product 或 technology 或 industry。\n标题:{title}\n内容:{content}"
+# 按优先级排列：回复同时含多个标签时取靠前者
+_PERSPECTIVE_LABELS: tuple[tuple[str, Perspective], ...] = (
+    ("product", Perspective.PRODUCT),
+    ("technology", Perspective.TECHNOLOGY),
+    ("industry", Perspective.INDUSTRY),
+)
+_PERSPECTIVE_HINTS: dict[Optional[Perspective], str] = {None: "mixed", **{p: p.value for p in Perspective}}
+
+
+def _throttle(client: Any) -> None:
+    # 缓存命中不占配额，因此在 _cached_llm 之内、真正发请求前取令牌
+    limiter: _TokenBucket | None = getattr(client, "limiter", None)
+    if limiter is not None:
+        limiter.acquire()
+
+
+def _build_summary_prompt(
+    title: str,
+    content: str,
+    source_name: str,
+    url: str,
+    perspective: Optional[Perspective] = None,
+) -> str:
+    return _SUMMARY_TMPL.format_map(
+        {
+            "perspective_hint": _PERSPECTIVE_HINTS[perspective],
+            "title": title,
+            "source_name": source_name,
+            "url": url,
+            "content": content[:4000],
+        }
+    )
+
+
+def _build_classify_prompt(title: str, content: str) -> str:
+    return _CLASSIFY_TMPL.format_map({"title": title, "content": content[:1200]})
+
+
+def _parse_perspective_label(raw: str) -> Optional[Perspective]:
+    lowered = raw.lower()
+    for label, perspective in _PERSPECTIVE_LABELS:
+        if label in lowered:
+            return perspective
+    return None
+
+
 class FallbackLLMClient:
     def classify_perspective(self, title: str, content: str) -> Optional[Perspective]:
         _ = (title, content)
@@ -191,11 +373,28 @@ class FallbackLLMClient:
 
 
 class OpenAILLMClient:
-    def __init__(self, api_key: str, model: str = "gpt-4o-mini") -> None:
-        self.client = OpenAI(api_key=api_key)
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "gpt-4o-mini",
+        cache: StateStore | None = None,
+        cache_ttl_hours: int = 72,
+        max_retries: int = DEFAULT_LLM_MAX_RETRIES,
+        requests_per_minute: int = 0,
+    ) -> None:
+        # SDK 自带对 429/5xx/超时/连接错误的指数退避重试（0.5s 起、8s 封顶、带抖动）
+        self.client = OpenAI(api_key=api_key, http_client=_shared_http_client(), max_retries=max_retries)
         self.model = model
+        self.cache = cache
+        self.cache_ttl_hours = cache_ttl_hours
+        self.limiter = _TokenBucket(requests_per_minute) if requests_per_minute > 0 else None
 
+    @_cached_llm
     def _chat(self, system_prompt: str, user_prompt: str) -> str:
+        return self._chat_uncached(system_prompt, user_prompt)
+
+    def _chat_uncached(self, system_prompt: str, user_prompt: str) -> str:
+        _throttle(self)
         resp = self.client.chat.completions.create(
             model=self.model,
             temperature=0.2,
@@ -207,18 +406,8 @@ class OpenAILLMClient:
         return (resp.choices[0].message.content or "").strip()
 
     def classify_perspective(self, title: str, content: str) -> Optional[Perspective]:
-        prompt = (
-            "请只输出一个英文标签：product 或 technology 或 industry。"
-            "\n标题:" + title + "\n内容:" + content[:1200]
-        )
-        raw = self._chat("你是AI资讯分类助手。", prompt).lower()
-        if "product" in raw:
-            return Perspective.PRODUCT
-        if "technology" in raw:
-            return Perspective.TECHNOLOGY
-        if "industry" in raw:
-            return Perspective.INDUSTRY
-        return None
+        prompt = _build_classify_prompt(title, content)
+        return _parse_perspective_label(self._chat("你是AI资讯分类助手。", prompt))
 
     def summarize_item_structured(
         self,
@@ -228,24 +417,12 @@ class OpenAILLMClient:
         url: str,
         perspective: Optional[Perspective] = None,
     ) -> dict[str, Any]:
-        perspective_hint = perspective.value if perspective is not None else "mixed"
-        prompt = (
-            "请将以下资讯总结为严格 JSON，不要输出任何额外文本。\n"
-            "返回格式："
-            "{\"importance\":\"high|medium|low\","
-            "\"insight\":\"一句话给出价值点\","
-            "\"points\":[\"要点1\",\"要点2\"]}\n"
-            "要求：\n"
-            "1) points 输出 2-4 条中文短句；\n"
-            "2) insight 合并意义与立场，给出价值点：可有一定前瞻性、可否定文章内容、可认可并延伸；不要中性复述；\n"
-            "3) importance 用 high/medium/low。\n"
-            f"\n视角提示:{perspective_hint}\n标题:{title}\n来源:{source_name}\n链接:{url}\n内容:{content[:4000]}"
-        )
+        prompt = _build_summary_prompt(title, content, source_name, url, perspective)
         raw = self._chat("你是严谨的科技编辑。", prompt)
         data = _safe_load_json(raw)
         if data is None:
             logger.warning("OpenAI summary JSON parse failed, fallback text output")
-            data = {"points": [raw[:120], "建议阅读原文确认关键细节。"]}
+            return _summary_from_raw_text(raw, title, content, source_name, url, perspective)
         return _normalize_summary_payload(
             data,
             title=title,
@@ -261,28 +438,50 @@ class OpenAILLMClient:
 
     def compose_intro(self, titles: list[str]) -> str:
         prompt = "请基于这些标题写3-5句中文日报导语：\n" + "\n".join(titles[:12])
-        return self._chat("你是AI日报主编。", prompt)
+        return self._chat_uncached("你是AI日报主编。", prompt)
 
     def compose_observations(self, snippets: list[str]) -> list[str]:
         prompt = (
             "请基于以下信息给出1-2条跨来源观察，返回JSON: {\"observations\":[\"...\"]}\n"
             + "\n".join(snippets[:20])
         )
-        raw = self._chat("你是行业分析师。", prompt)
+        raw = self._chat_uncached("你是行业分析师。", prompt)
         data = _safe_load_json(raw)
         if data is not None:
-            obs = [str(i).strip() for i in data.get("observations", []) if str(i).strip()]
+            obs = [text for i in data.get("observations", []) if (text := str(i).strip())]
             if obs:
                 return obs[:2]
         return ["今日信息显示模型能力迭代与应用落地持续共振。"]
 
 
 class VolcengineLLMClient:
-    def __init__(self, api_key: str, base_url: str, model: str = "doubao-seed-1-8-251228") -> None:
-        self.client = OpenAI(base_url=base_url, api_key=api_key)
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str,
+        model: str = "doubao-seed-1-8-251228",
+        cache: StateStore | None = None,
+        cache_ttl_hours: int = 72,
+        max_retries: int = DEFAULT_LLM_MAX_RETRIES,
+        requests_per_minute: int = 0,
+    ) -> None:
+        self.client = OpenAI(
+            base_url=base_url,
+            api_key=api_key,
+            http_client=_shared_http_client(),
+            max_retries=max_retries,
+        )
         self.model = model
+        self.cache = cache
+        self.cache_ttl_hours = cache_ttl_hours
+        self.limiter = _TokenBucket(requests_per_minute) if requests_per_minute > 0 else None
 
+    @_cached_llm
     def _respond(self, system_prompt: str, user_prompt: str) -> str:
+        return self._respond_uncached(system_prompt, user_prompt)
+
+    def _respond_uncached(self, system_prompt: str, user_prompt: str) -> str:
+        _throttle(self)
         merged_prompt = f"{system_prompt}\n\n{user_prompt}"
         response = self.client.responses.create(
             model=self.model,
@@ -302,21 +501,12 @@ class VolcengineLLMClient:
         return text.strip()
 
     def ping(self) -> str:
-        return self._respond("你是助手。", "请只回复：连接成功")
+        # 连通性检查必须真实请求，绕过回复缓存
+        return self._respond_uncached("你是助手。", "请只回复：连接成功")
 
     def classify_perspective(self, title: str, content: str) -> Optional[Perspective]:
-        prompt = (
-            "请只输出一个英文标签：product 或 technology 或 industry。"
-            "\n标题:" + title + "\n内容:" + content[:1200]
-        )
-        raw = self._respond("你是AI资讯分类助手。", prompt).lower()
-        if "product" in raw:
-            return Perspective.PRODUCT
-        if "technology" in raw:
-            return Perspective.TECHNOLOGY
-        if "industry" in raw:
-            return Perspective.INDUSTRY
-        return None
+        prompt = _build_classify_prompt(title, content)
+        return _parse_perspective_label(self._respond("你是AI资讯分类助手。", prompt))
 
     def summarize_item_structured(
         self,
@@ -326,24 +516,12 @@ class VolcengineLLMClient:
         url: str,
         perspective: Optional[Perspective] = None,
     ) -> dict[str, Any]:
-        perspective_hint = perspective.value if perspective is not None else "mixed"
-        prompt = (
-            "请将以下资讯总结为严格 JSON，不要输出任何额外文本。\n"
-            "返回格式："
-            "{\"importance\":\"high|medium|low\","
-            "\"insight\":\"一句话给出价值点\","
-            "\"points\":[\"要点1\",\"要点2\"]}\n"
-            "要求：\n"
-            "1) points 输出 2-4 条中文短句；\n"
-            "2) insight 合并意义与立场，给出价值点：可有一定前瞻性、可否定文章内容、可认可并延伸；不要中性复述；\n"
-            "3) importance 用 high/medium/low。\n"
-            f"\n视角提示:{perspective_hint}\n标题:{title}\n来源:{source_name}\n链接:{url}\n内容:{content[:4000]}"
-        )
+        prompt = _build_summary_prompt(title, content, source_name, url, perspective)
         raw = self._respond("你是严谨的科技编辑。", prompt)
         data = _safe_load_json(raw)
         if data is None:
             logger.warning("Volcengine summary JSON parse failed, fallback text output")
-            data = {"points": [raw[:120], "建议阅读原文确认关键细节。"]}
+            return _summary_from_raw_text(raw, title, content, source_name, url, perspective)
         return _normalize_summary_payload(
             data,
             title=title,
@@ -359,17 +537,17 @@ class VolcengineLLMClient:
 
     def compose_intro(self, titles: list[str]) -> str:
         prompt = "请基于这些标题写3-5句中文日报导语：\n" + "\n".join(titles[:12])
-        return self._respond("你是AI日报主编。", prompt)
+        return self._respond_uncached("你是AI日报主编。", prompt)
 
     def compose_observations(self, snippets: list[str]) -> list[str]:
         prompt = (
             "请基于以下信息给出1-2条跨来源观察，返回JSON: {\"observations\":[\"...\"]}\n"
             + "\n".join(snippets[:20])
         )
-        raw = self._respond("你是行业分析师。", prompt)
+        raw = self._respond_uncached("你是行业分析师。", prompt)
         data = _safe_load_json(raw)
         if data is not None:
-            obs = [str(i).strip() for i in data.get("observations", []) if str(i).strip()]
+            obs = [text for i in data.get("observations", []) if (text := str(i).strip())]
             if obs:
                 return obs[:2]
         logger.warning("Volcengine observations JSON parse failed")
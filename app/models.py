@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+import re
 from datetime import date, datetime, timezone
 from enum import Enum
 from typing import Literal, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr, model_validator
+
+# 单次 LLM 请求的默认重试次数，Settings 与各 LLM 客户端共用
+DEFAULT_LLM_MAX_RETRIES = 3
 
 
 class Perspective(str, Enum):
@@ -89,6 +93,24 @@ class SourceConfig(BaseModel):
     wechat_biz: Optional[str] = None  # wechat_profile 源使用的 __biz
     split_source_by_publisher: bool = False  # 聚合源按正文里的发布方拆分 source_name
 
+    # 动态正则在构造时编译一次，采集时直接复用
+    _link_re: Optional[re.Pattern[str]] = PrivateAttr(default=None)
+    _date_re: Optional[re.Pattern[str]] = PrivateAttr(default=None)
+
+    @model_validator(mode="after")
+    def _compile_patterns(self) -> "SourceConfig":
+        self._link_re = re.compile(self.link_pattern) if self.link_pattern else None
+        self._date_re = re.compile(self.date_regex) if self.date_regex else None
+        return self
+
+    @property
+    def link_re(self) -> Optional[re.Pattern[str]]:
+        return self._link_re
+
+    @property
+    def date_re(self) -> Optional[re.Pattern[str]]:
+        return self._date_re
+
 
 class Settings(BaseModel):
     timezone: str
@@ -100,6 +122,10 @@ class Settings(BaseModel):
     max_items_per_source: int = 2
     llm_provider: Literal["openai", "volcengine"] = "volcengine"
     llm_model: str = "doubao-seed-1-8-251228"
+    llm_max_concurrency: int = 16  # 逐条摘要的并发请求上限，按服务商限流调整
+    llm_cache_ttl_hours: int = 72  # 逐条分类/摘要回复的缓存有效期（存于 db_path），0 表示关闭
+    llm_max_retries: int = DEFAULT_LLM_MAX_RETRIES  # 单次 LLM 请求遇限流/5xx/超时后的最大重试次数
+    llm_qpm: int = 0  # LLM 每分钟请求上限（令牌桶匀速放行），按服务商配额设置，0 表示不限
     volcengine_base_url: str = "https://ark.cn-beijing.volces.com/api/v3"
     ark_api_key: str = ""
     push_enabled: bool = False
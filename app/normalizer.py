@@ -36,7 +36,10 @@ AI_KEYWORDS = {
     "芯片",
 }
 
-_TRACKING_QUERY_KEYS = {
+# 关键词合成一个交替式，一次扫描即可判断是否命中任一关键词；标题在前，AI 资讯通常在开头就命中
+_AI_KEYWORD_PATTERN = re.compile("|".join(re.escape(keyword) for keyword in sorted(AI_KEYWORDS, key=len, reverse=True)))
+
+_TRACKING_QUERY_KEYS = frozenset({
     "utm_source",
     "utm_medium",
     "utm_campaign",
@@ -45,40 +48,50 @@ _TRACKING_QUERY_KEYS = {
     "spm",
     "from",
     "source",
-}
+})
+
+
+_TAG_PATTERN = re.compile(r"<[^>]+>")
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+_ZH_CHAR_PATTERN = re.compile(r"[\u4e00-\u9fff]")
+_EN_CHAR_PATTERN = re.compile(r"[A-Za-z]")
 
 
 def clean_text(text: str) -> str:
-    text = re.sub(r"<[^>]+>", " ", text)
-    text = re.sub(r"\s+", " ", text).strip()
+    text = _TAG_PATTERN.sub(" ", text)
+    text = _WHITESPACE_PATTERN.sub(" ", text).strip()
     return text
 
 
 def detect_language(text: str) -> str:
     if not text:
         return "unknown"
-    zh_chars = len(re.findall(r"[\u4e00-\u9fff]", text))
-    en_chars = len(re.findall(r"[A-Za-z]", text))
-    if zh_chars > 0 and en_chars == 0:
+    # 判定只关心两类字符是否出现，首个命中即停止扫描，无需计数
+    has_zh = _ZH_CHAR_PATTERN.search(text) is not None
+    has_en = _EN_CHAR_PATTERN.search(text) is not None
+    if has_zh and not has_en:
         return "zh"
-    if en_chars > 0 and zh_chars == 0:
+    if has_en and not has_zh:
         return "en"
-    if zh_chars > 0 and en_chars > 0:
+    if has_zh and has_en:
         return "mixed"
     return "unknown"
 
 
 def canonicalize_url(url: str) -> str:
     parts = urlsplit(url)
-    query = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if k not in _TRACKING_QUERY_KEYS]
-    normalized_query = urlencode(sorted(query))
+    # 无查询串时跳过 parse_qsl/urlencode 往返，结果与完整流程一致
+    normalized_query = ""
+    if parts.query:
+        query = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if k not in _TRACKING_QUERY_KEYS]
+        normalized_query = urlencode(sorted(query))
     cleaned = urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path.rstrip("/"), normalized_query, ""))
     return cleaned
 
 
-def is_ai_related(title: str, content: str, tags: list[str]) -> bool:
-    merged = f"{title} {content}".lower()
-    if any(keyword in merged for keyword in AI_KEYWORDS):
+def is_ai_related(title: str, content: str, tags: list[str], merged_lower: str | None = None) -> bool:
+    merged = merged_lower if merged_lower is not None else f"{title} {content}".lower()
+    if _AI_KEYWORD_PATTERN.search(merged):
         return True
 
     return False
@@ -101,7 +114,9 @@ def normalize_items(raw_items: list[RawItem], since: datetime, until: datetime)
         content = clean_text(item.content)
         if not title:
             continue
-        if not is_ai_related(title, content, item.tags):
+        # 标题与正文只拼接一次，关键词匹配用小写副本，语言检测用原文
+        merged = f"{title} {content}"
+        if not is_ai_related(title, content, item.tags, merged_lower=merged.lower()):
             continue
 
         if item.published_at is None:
@@ -111,7 +126,7 @@ def normalize_items(raw_items: list[RawItem], since: datetime, until: datetime)
 
         canonical_url = canonicalize_url(item.url)
         item_id = make_item_id(canonical_url, title)
-        language = detect_language(f"{title} {content}")
+        language = detect_language(merged)
         normalized.append(
             NormalizedItem(
                 item_id=item_id,
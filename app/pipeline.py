@@ -1,13 +1,13 @@
 from __future__ import annotations
 
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 from zoneinfo import ZoneInfo
 
 from app.classifier import classify_items
-from app.collector import collect_from_source
+from app.collector import collect_from_sources
 from app.config import load_settings, load_sources
 from app.deduper import dedupe_items
 from app.feishu import push_feishu_text, split_text_for_feishu
@@ -23,17 +23,34 @@ from app.wecom import push_wecom_message, split_text_for_wecom
 logger = logging.getLogger(__name__)
 
 
-def _build_llm_client(settings: Settings, override: Optional[LLMClient] = None) -> LLMClient:
+def _build_llm_client(
+    settings: Settings,
+    override: Optional[LLMClient] = None,
+    cache: Optional[StateStore] = None,
+) -> LLMClient:
     if override is not None:
         return override
+    if settings.llm_cache_ttl_hours <= 0:
+        cache = None
     if settings.llm_provider == "volcengine" and settings.ark_api_key:
         return VolcengineLLMClient(
             api_key=settings.ark_api_key,
             base_url=settings.volcengine_base_url,
             model=settings.llm_model,
+            cache=cache,
+            cache_ttl_hours=settings.llm_cache_ttl_hours,
+            max_retries=settings.llm_max_retries,
+            requests_per_minute=settings.llm_qpm,
         )
     if settings.llm_provider == "openai" and settings.openai_api_key:
-        return OpenAILLMClient(api_key=settings.openai_api_key, model=settings.llm_model)
+        return OpenAILLMClient(
+            api_key=settings.openai_api_key,
+            model=settings.llm_model,
+            cache=cache,
+            cache_ttl_hours=settings.llm_cache_ttl_hours,
+            max_retries=settings.llm_max_retries,
+            requests_per_minute=settings.llm_qpm,
+        )
     logger.warning("No valid LLM key found for provider=%s, fallback to heuristic summarizer", settings.llm_provider)
     return FallbackLLMClient()
 
@@ -49,24 +66,34 @@ def collect_all_sources(
     if not sources:
         return raw_items, source_errors
 
-    max_workers = min(8, max(1, len(sources)))
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        future_map = {
-            executor.submit(collect_from_source, source, timeout_seconds, proxy): source.name
-            for source in sources
-        }
-        for future in as_completed(future_map):
-            source_name = future_map[future]
-            try:
-                items = future.result()
-                raw_items.extend(items)
-            except Exception as exc:  # noqa: BLE001
-                source_errors[source_name] = str(exc)
-                logger.warning("Source failed: %s | %s", source_name, exc)
+    for source, result in zip(sources, collect_from_sources(sources, timeout_seconds, proxy)):
+        if isinstance(result, Exception):
+            source_errors[source.name] = str(result)
+            logger.warning("Source failed: %s | %s", source.name, result)
+            continue
+        raw_items.extend(result)
 
     return raw_items, source_errors
 
 
+def _push_feishu_chunks(settings: Settings, target: str, title: str, chunks: list[str]) -> bool:
+    ok_all = True
+    total = len(chunks)
+    for idx, chunk in enumerate(chunks, start=1):
+        header = f"[{title}] 第{idx}/{total}段\n" if total > 1 else ""
+        ok = push_feishu_text(
+            app_id=settings.feishu_app_id,
+            app_secret=settings.feishu_app_secret,
+            base_url=settings.feishu_base_url,
+            receive_id=target,
+            receive_id_type=settings.feishu_receive_id_type,
+            content=header + chunk,
+        )
+        if not ok:
+            ok_all = False
+    return ok_all
+
+
 def _build_source_hit_stats(
     raw_items: list,
     sources: list[SourceConfig],
@@ -135,33 +162,54 @@ def _build_importance_fallback(selected_items: list[RankedItem]) -> dict[str, st
     return importance_map
 
 
-def _build_brief(
-    selected_items: list[RankedItem],
-    llm: LLMClient,
-    run_time: datetime,
-    tz_name: str,
-) -> DailyBrief:
+def _summarize_item(llm: LLMClient, item: RankedItem) -> dict:
+    try:
+        return llm.summarize_item_structured(
+            item.title,
+            item.content,
+            item.source_name,
+            item.url,
+            perspective=item.perspective,
+        )
+    except Exception:  # noqa: BLE001
+        return FallbackLLMClient().summarize_item_structured(
+            item.title,
+            item.content,
+            item.source_name,
+            item.url,
+            perspective=item.perspective,
+        )
+
+
+def _summarize_items(llm: LLMClient, selected_items: list[RankedItem], max_concurrency: int) -> list[dict]:
+    """逐条摘要是网络等待为主的 LLM 调用，用线程池并发发出；结果顺序与输入一致。"""
+    workers = min(max_concurrency, len(selected_items))
+    if workers <= 1:
+        return [_summarize_item(llm, item) for item in selected_items]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(lambda item: _summarize_item(llm, item), selected_items))
+
+
+def _compose_intro(llm: LLMClient, titles: list[str]) -> str:
+    try:
+        return llm.compose_intro(titles)
+    except Exception:  # noqa: BLE001
+        return FallbackLLMClient().compose_intro(titles)
+
+
+def _compose_observations(llm: LLMClient, snippets: list[str]) -> list[str]:
+    try:
+        return llm.compose_observations(snippets)
+    except Exception:  # noqa: BLE001
+        return FallbackLLMClient().compose_observations(snippets)
+
+
+def _build_brief_items(selected_items: list[RankedItem], llm: LLMClient, max_concurrency: int) -> list[BriefItem]:
     brief_items: list[BriefItem] = []
     importance_fallback = _build_importance_fallback(selected_items)
-    for item in selected_items:
-        try:
-            summary = llm.summarize_item_structured(
-                item.title,
-                item.content,
-                item.source_name,
-                item.url,
-                perspective=item.perspective,
-            )
-        except Exception:  # noqa: BLE001
-            summary = FallbackLLMClient().summarize_item_structured(
-                item.title,
-                item.content,
-                item.source_name,
-                item.url,
-                perspective=item.perspective,
-            )
-
-        key_points = [str(p).strip() for p in summary.get("points", []) if str(p).strip()][:4]
+    summaries = _summarize_items(llm, selected_items, max_concurrency)
+    for item, summary in zip(selected_items, summaries):
+        key_points = [text for p in summary.get("points", []) if (text := str(p).strip())][:4]
         if len(key_points) < 2:
             key_points.append("建议阅读原文了解完整信息。")
 
@@ -185,19 +233,24 @@ def _build_brief(
                 insight=insight,
             )
         )
+    return brief_items
 
-    titles = [item.title for item in brief_items]
-    snippets = [f"{item.title} {'; '.join(item.key_points)}" for item in brief_items]
 
-    try:
-        intro = llm.compose_intro(titles)
-    except Exception:  # noqa: BLE001
-        intro = FallbackLLMClient().compose_intro(titles)
-
-    try:
-        observations = llm.compose_observations(snippets)
-    except Exception:  # noqa: BLE001
-        observations = FallbackLLMClient().compose_observations(snippets)
+def _build_brief(
+    selected_items: list[RankedItem],
+    llm: LLMClient,
+    run_time: datetime,
+    tz_name: str,
+    max_concurrency: int = 1,
+) -> DailyBrief:
+    titles = [item.title for item in selected_items]
+    # 导语只依赖标题，与逐条摘要并行发出；跨来源观察依赖摘要要点，仍在摘要之后
+    with ThreadPoolExecutor(max_workers=1) as intro_executor:
+        intro_future = intro_executor.submit(_compose_intro, llm, titles)
+        brief_items = _build_brief_items(selected_items, llm, max_concurrency)
+        snippets = [f"{item.title} {'; '.join(item.key_points)}" for item in brief_items]
+        observations = _compose_observations(llm, snippets)
+        intro = intro_future.result()
 
     local_date = run_time.astimezone(ZoneInfo(tz_name)).date()
     title = f"AI 每日情报 | {local_date.isoformat()}"
@@ -237,10 +290,9 @@ def run_daily_pipeline(
     settings = load_settings(settings_path)
     sources = load_sources(sources_path)
     ensure_rsshub_for_sources(sources)
-    llm = _build_llm_client(settings, llm_client)
-
     store = StateStore(settings.db_path)
-    store.init_db()
+    store.init_db(llm_cache_ttl_hours=settings.llm_cache_ttl_hours)
+    llm = _build_llm_client(settings, llm_client, cache=store)
 
     metrics = {
         "source_count": len(sources),
@@ -308,10 +360,16 @@ def run_daily_pipeline(
         )
         metrics["selected_count"] = len(selected)
 
-        brief = _build_brief(selected, llm, run_time=run_time, tz_name=settings.timezone)
-        archive_brief(brief, settings.archives_dir)
-
+        brief = _build_brief(
+            selected,
+            llm,
+            run_time=run_time,
+            tz_name=settings.timezone,
+            max_concurrency=settings.llm_max_concurrency,
+        )
         markdown = render_markdown(brief)
+        archive_brief(brief, settings.archives_dir, markdown=markdown)
+
         if push_enabled:
             push_attempted = False
             push_errors: list[str] = []
@@ -327,22 +385,16 @@ def run_daily_pipeline(
                 feishu_chunks = split_text_for_feishu(markdown, max_chars=3000)
                 if not feishu_chunks:
                     feishu_chunks = [f"执行完成：{brief.title}（无可用内容）"]
-                feishu_ok = True
-                for target in settings.feishu_push_targets:
-                    total = len(feishu_chunks)
-                    for idx, chunk in enumerate(feishu_chunks, start=1):
-                        header = f"[{brief.title}] 第{idx}/{total}段\n" if total > 1 else ""
-                        ok = push_feishu_text(
-                            app_id=settings.feishu_app_id,
-                            app_secret=settings.feishu_app_secret,
-                            base_url=settings.feishu_base_url,
-                            receive_id=target,
-                            receive_id_type=settings.feishu_receive_id_type,
-                            content=header + chunk,
+                # 各推送目标之间并发，同一目标内的分段仍按顺序发送，保证会话里段落有序
+                targets = settings.feishu_push_targets
+                with ThreadPoolExecutor(max_workers=min(8, len(targets))) as executor:
+                    results = list(
+                        executor.map(
+                            lambda target: _push_feishu_chunks(settings, target, brief.title, feishu_chunks),
+                            targets,
                         )
-                        if not ok:
-                            feishu_ok = False
-                if not feishu_ok:
+                    )
+                if not all(results):
                     push_errors.append("feishu")
 
             wecom_targets = _normalize_push_targets(settings.wecom_push_targets)
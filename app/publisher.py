@@ -11,31 +11,23 @@ import httpx
 from app.models import DailyBrief
 
 
-def _perspective_label(value: str) -> str:
-    mapping = {
-        "product": "产品视角",
-        "technology": "技术视角",
-        "industry": "行业视角",
-    }
-    return mapping.get(value, "综合视角")
-
+_PERSPECTIVE_LABELS = {
+    "product": "产品视角",
+    "technology": "技术视角",
+    "industry": "行业视角",
+}
 
-def _importance_label(value: str) -> str:
-    mapping = {
-        "high": "重要",
-        "medium": "关注",
-        "low": "速览",
-    }
-    return mapping.get(value, "关注")
+_IMPORTANCE_LABELS = {
+    "high": "重要",
+    "medium": "关注",
+    "low": "速览",
+}
 
-
-def _key_point_limit(value: str) -> int:
-    mapping = {
-        "high": 4,
-        "medium": 3,
-        "low": 2,
-    }
-    return mapping.get(value, 3)
+_KEY_POINT_LIMITS = {
+    "high": 4,
+    "medium": 3,
+    "low": 2,
+}
 
 
 def render_markdown(brief: DailyBrief) -> str:
@@ -45,14 +37,17 @@ def render_markdown(brief: DailyBrief) -> str:
     lines.append(f"**导语**：{brief.intro}")
     lines.append("")
 
+    perspective_label = _PERSPECTIVE_LABELS.get
+    importance_label = _IMPORTANCE_LABELS.get
+    key_point_limit = _KEY_POINT_LIMITS.get
     for idx, item in enumerate(brief.items, start=1):
-        perspective_text = _perspective_label(item.perspective.value)
-        importance_text = _importance_label(item.importance)
+        perspective_text = perspective_label(item.perspective.value, "综合视角")
+        importance_text = importance_label(item.importance, "关注")
         lines.append(f"## {idx}、【{importance_text}】【{perspective_text}】{item.title}")
         lines.append(f"- 来源：{item.source_name}")
         lines.append(f"- 原文链接：{item.url}")
         lines.append("- 关键信息：")
-        for point in item.key_points[: _key_point_limit(item.importance)]:
+        for point in item.key_points[: key_point_limit(item.importance, 3)]:
             lines.append(f"  - {point}")
         insight = item.insight.strip() or "该信息可能影响后续选题优先级与资源投入，建议结合业务目标跟踪。"
         lines.append(f"- insight：{insight}")
@@ -129,13 +124,15 @@ def send_failure_alert(webhook: str, error_message: str, client: httpx.Client |
             client.close()
 
 
-def archive_brief(brief: DailyBrief, archives_dir: str) -> tuple[str, str]:
+def archive_brief(brief: DailyBrief, archives_dir: str, markdown: str | None = None) -> tuple[str, str]:
+    """归档 markdown 与 JSON；调用方已渲染过 markdown 时直接传入，避免重复渲染。"""
     Path(archives_dir).mkdir(parents=True, exist_ok=True)
     date_str = brief.date.isoformat()
     md_path = Path(archives_dir) / f"{date_str}.md"
     json_path = Path(archives_dir) / f"{date_str}.json"
 
-    markdown = render_markdown(brief)
+    if markdown is None:
+        markdown = render_markdown(brief)
     md_path.write_text(markdown, encoding="utf-8")
 
     payload = brief.model_dump(mode="json")
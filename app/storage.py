@@ -14,7 +14,8 @@ class StateStore:
         conn.row_factory = sqlite3.Row
         return conn
 
-    def init_db(self) -> None:
+    def init_db(self, llm_cache_ttl_hours: int | None = None) -> None:
+        """建表；传入 llm_cache_ttl_hours 时顺带清理超过有效期的 LLM 回复缓存（0 表示全部清理）。"""
         with self._connect() as conn:
             conn.execute(
                 """
@@ -36,6 +37,18 @@ class StateStore:
                 )
                 """
             )
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS llm_cache (
+                    cache_key TEXT PRIMARY KEY,
+                    response TEXT NOT NULL,
+                    created_at TEXT NOT NULL
+                )
+                """
+            )
+            if llm_cache_ttl_hours is not None:
+                since = datetime.now(timezone.utc) - timedelta(hours=max(llm_cache_ttl_hours, 0))
+                conn.execute("DELETE FROM llm_cache WHERE created_at < ?", (since.isoformat(),))
 
     def load_seen_item_ids(self, days: int = 7) -> set[str]:
         since = datetime.now(timezone.utc) - timedelta(days=days)
@@ -57,6 +70,25 @@ class StateStore:
                 [(item_id, canonical_url, now) for item_id, canonical_url in items],
             )
 
+    def get_llm_response(self, cache_key: str, ttl_hours: int) -> str | None:
+        since = datetime.now(timezone.utc) - timedelta(hours=ttl_hours)
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT response FROM llm_cache WHERE cache_key = ? AND created_at >= ?",
+                (cache_key, since.isoformat()),
+            ).fetchone()
+        return row["response"] if row is not None else None
+
+    def put_llm_response(self, cache_key: str, response: str) -> None:
+        with self._connect() as conn:
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO llm_cache(cache_key, response, created_at)
+                VALUES (?, ?, ?)
+                """,
+                (cache_key, response, datetime.now(timezone.utc).isoformat()),
+            )
+
     def has_recent_successful_push_run(self, hours: int = 24) -> bool:
         since = datetime.now(timezone.utc) - timedelta(hours=hours)
         with self._connect() as conn:
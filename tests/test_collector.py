@@ -2,18 +2,72 @@
 from __future__ import annotations
 
 import os
+from contextlib import contextmanager
 from datetime import datetime, timezone
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
+import pytest
+
+from app import collector
 from app.collector import (
+    _extract_article_published_at,
     _extract_sogou_redirect_url,
     _extract_date_from_element,
+    _extract_publisher_from_text,
+    _parse_html,
     _parse_html_date,
     collect_from_source,
+    collect_from_sources,
 )
 from app.models import SourceConfig
 
 
+@pytest.fixture(autouse=True)
+def _clear_collector_caches():
+    """跨用例复用的 URL 级缓存在每个用例前清空，避免相互影响。"""
+    collector._ARTICLE_DATE_CACHE.clear()
+    collector._CONDITIONAL_CACHE.clear()
+    yield
+
+
+class _StreamedResp:
+    """把测试桩的 get 响应包装成流式响应：按块吐出 text，其余属性透传。"""
+
+    def __init__(self, resp) -> None:
+        self._resp = resp
+        self.encoding = "utf-8"
+
+    def iter_bytes(self):
+        body = self._resp.text.encode("utf-8")
+        for start in range(0, len(body), 65536):
+            yield body[start : start + 65536]
+
+    def __getattr__(self, name: str):
+        return getattr(self._resp, name)
+
+
+@pytest.fixture(autouse=True)
+def _stream_through_mocked_get():
+    """被 patch 的 httpx.Client 上，client.stream 复用用例为 client.get 配置的响应。"""
+    build_client = collector._build_client
+
+    def _build(*args, **kwargs):
+        built = build_client(*args, **kwargs)
+        if isinstance(built, MagicMock):
+            client = built.__enter__.return_value
+
+            @contextmanager
+            def _stream(method, url, **stream_kwargs):
+                headers = stream_kwargs.get("headers")
+                yield _StreamedResp(client.get(url, headers=headers) if headers is not None else client.get(url))
+
+            client.stream.side_effect = _stream
+        return built
+
+    with patch("app.collector._build_client", side_effect=_build):
+        yield
+
+
 def test_parse_html_date_absolute() -> None:
     """解析绝对日期 YYYY-MM-DD HH:MM。"""
     ref = datetime(2026, 2, 24, 12, 0, 0, tzinfo=timezone.utc)
@@ -84,6 +138,13 @@ def test_parse_html_date_chinese_ymd_hour_only() -> None:
     assert result.minute == 0
 
 
+def test_parse_html_date_fixed_width_ymd() -> None:
+    """定宽年月日（含全角冒号时间）与非法日期的解析结果。"""
+    assert _parse_html_date("2026年02月05日 09：30") == datetime(2026, 2, 5, 9, 30, tzinfo=timezone.utc)
+    assert _parse_html_date("2026-02-05") == datetime(2026, 2, 5, tzinfo=timezone.utc)
+    assert _parse_html_date("2026/13/05") is None
+
+
 def test_parse_html_date_unix_timestamp() -> None:
     """解析 10 位 Unix 时间戳（用于 timeConvert）。"""
     result = _parse_html_date("timeConvert('1771988408')", regex=r"(?<=timeConvert\(')\d{10}(?='\))")
@@ -98,6 +159,30 @@ def test_parse_html_date_empty() -> None:
     assert _parse_html_date("   ") is None
 
 
+def test_parse_html_date_without_digits() -> None:
+    """不含数字的文本只识别刚刚/昨天/今天，其余直接返回 None。"""
+    ref = datetime(2026, 2, 24, 12, 0, 0, tzinfo=timezone.utc)
+    assert _parse_html_date("更多精彩内容 Read more", ref_time=ref) is None
+    assert _parse_html_date("刚刚", ref_time=ref) == ref
+    assert _parse_html_date("昨天", ref_time=ref, allow_relative=False) is None
+
+
+def test_extract_article_published_at_prefers_meta_priority() -> None:
+    """meta 候选按标签优先级而非文档顺序选取。"""
+    html = """
+    <html><head>
+      <meta name="date" content="2025-01-01 10:00" />
+      <meta property="article:published_time" content="2026-02-24 09:30" />
+    </head><body><time>2024-03-03</time></body></html>
+    """
+    ref = datetime(2026, 2, 25, 0, 0, 0, tzinfo=timezone.utc)
+    result = _extract_article_published_at(_parse_html(html), ref)
+    assert result is not None
+    assert result.year == 2026
+    assert result.month == 2
+    assert result.day == 24
+
+
 def test_collect_html_with_date_from_mock() -> None:
     """使用 mock HTML 测试带日期解析的采集。"""
     html = """
@@ -283,6 +368,132 @@ def test_collect_html_fallback_article_page_date() -> None:
     assert items[0].published_at.day == 24
 
 
+def test_collect_html_reuses_cached_article_date() -> None:
+    """同一文章页的发布时间只回源一次，后续采集直接复用缓存。"""
+    list_html = """
+    <html><body>
+    <a href="https://example.com/p/777.html">智东西AI新闻缓存测试</a>
+    </body></html>
+    """
+    article_html = """
+    <html><head>
+      <meta property="article:published_time" content="2026-02-24T09:30:00+08:00" />
+    </head><body>正文</body></html>
+    """
+    source = SourceConfig(
+        name="test_article_date_cache",
+        type="html",
+        url="https://example.com/",
+        article_selector="a[href*='/p/']",
+        link_pattern=r"example\.com/p/",
+    )
+
+    class _Resp:
+        def __init__(self, text: str) -> None:
+            self.text = text
+
+        @staticmethod
+        def raise_for_status() -> None:
+            return None
+
+    fetched: list[str] = []
+
+    def _get(url, *args, **kwargs):
+        fetched.append(url)
+        return _Resp(article_html if url.endswith("777.html") else list_html)
+
+    with patch("app.collector.httpx.Client") as mock_client:
+        mock_client.return_value.__enter__.return_value.get.side_effect = _get
+        first = collect_from_source(source, timeout_seconds=5)
+        second = collect_from_source(source, timeout_seconds=5)
+
+    assert fetched.count("https://example.com/p/777.html") == 1
+    assert first[0].published_at == second[0].published_at
+
+
+def test_collect_html_refetches_article_without_date() -> None:
+    """文章页未解析出发布时间时不缓存，下一轮仍会回源。"""
+    list_html = """
+    <html><body>
+    <a href="https://example.com/p/778.html">智东西AI新闻无日期测试</a>
+    </body></html>
+    """
+    source = SourceConfig(
+        name="test_article_date_miss",
+        type="html",
+        url="https://example.com/",
+        article_selector="a[href*='/p/']",
+        link_pattern=r"example\.com/p/",
+    )
+
+    class _Resp:
+        def __init__(self, text: str) -> None:
+            self.text = text
+
+        @staticmethod
+        def raise_for_status() -> None:
+            return None
+
+    fetched: list[str] = []
+
+    def _get(url, *args, **kwargs):
+        fetched.append(url)
+        return _Resp("<html><body>正文</body></html>" if url.endswith("778.html") else list_html)
+
+    with patch("app.collector.httpx.Client") as mock_client:
+        mock_client.return_value.__enter__.return_value.get.side_effect = _get
+        first = collect_from_source(source, timeout_seconds=5)
+        second = collect_from_source(source, timeout_seconds=5)
+
+    assert first == second == []
+    assert fetched.count("https://example.com/p/778.html") == 2
+
+
+def test_collect_html_fallback_article_pages_keep_list_order() -> None:
+    """多篇文章页并发回源时，结果仍保持列表页顺序。"""
+    list_html = """
+    <html><body>
+    <a href="https://example.com/p/1.html">第一条智东西AI新闻测试</a>
+    <a href="https://example.com/p/2.html">第二条智东西AI新闻测试</a>
+    <a href="https://example.com/p/3.html">第三条智东西AI新闻测试</a>
+    </body></html>
+    """
+    article_html = """
+    <html><head>
+      <meta property="article:published_time" content="2026-02-2{day}T09:30:00+08:00" />
+    </head><body>正文</body></html>
+    """
+    source = SourceConfig(
+        name="test_fallback_article_order",
+        type="html",
+        url="https://example.com/",
+        article_selector="a[href*='/p/']",
+        link_pattern=r"example\.com/p/",
+    )
+
+    class _Resp:
+        def __init__(self, text: str) -> None:
+            self.text = text
+
+        @staticmethod
+        def raise_for_status() -> None:
+            return None
+
+    def _get(url: str, **_kwargs) -> _Resp:
+        if url == source.url:
+            return _Resp(list_html)
+        day = url.rsplit("/", 1)[-1].split(".")[0]
+        return _Resp(article_html.replace("{day}", day))
+
+    with patch("app.collector.httpx.Client") as mock_client:
+        client = mock_client.return_value.__enter__.return_value
+        client.get.side_effect = _get
+        items = collect_from_source(source, timeout_seconds=5)
+
+    assert [item.title[:3] for item in items] == ["第一条", "第二条", "第三条"]
+    assert [item.published_at.day for item in items] == [21, 22, 23]
+
+
 def test_collect_html_fallback_article_page_ignores_relative_words_in_body() -> None:
     """文章正文里的“今天”不应被误判为发布时间。"""
     list_html = """
@@ -433,6 +644,264 @@ def test_collect_rss_filters_by_required_author_keywords_any() -> None:
     assert items[0].url == "https://example.com/b"
 
 
+def test_collect_rss_stream_parses_bytes_content() -> None:
+    """响应提供字节内容时走流式解析，字段与 feedparser 口径一致。"""
+    rss = """<?xml version="1.0" encoding="UTF-8"?>
+    <rss version="2.0" xmlns:dc="http://purl.org/dc/elements/1.1/">
+      <channel>
+        <title>test</title>
+        <item>
+          <title>AI 条目</title>
+          <link>https://example.com/s/1</link>
+          <dc:creator>目标号</dc:creator>
+          <description><![CDATA[<p>本文来自微信公众号：目标号</p>]]></description>
+          <pubDate>Wed, 25 Feb 2026 02:00:00 +0800</pubDate>
+        </item>
+      </channel>
+    </rss>
+    """.strip()
+    source = SourceConfig(
+        name="test_rss_stream",
+        type="rss",
+        url="https://example.com/rss.xml",
+        required_author_keywords_any=["目标号"],
+    )
+
+    with patch("app.collector.httpx.Client") as mock_client:
+        mock_resp = mock_client.return_value.__enter__.return_value.get.return_value
+        mock_resp.text = rss
+        mock_resp.content = rss.encode("utf-8")
+        mock_resp.raise_for_status = lambda: None
+        items = collect_from_source(source, timeout_seconds=5)
+
+    assert len(items) == 1
+    assert items[0].title == "AI 条目"
+    assert items[0].url == "https://example.com/s/1"
+    assert "目标号" in items[0].content
+    assert items[0].published_at == datetime(2026, 2, 24, 18, 0, tzinfo=timezone.utc)
+
+
+def test_parse_feed_entries_resolves_relative_atom_links_like_feedparser() -> None:
+    """Atom 相对链接按 xml:base 解析，未声明时相对 feed 地址，流式解析与 feedparser 结果一致。"""
+    atom = """<?xml version="1.0" encoding="UTF-8"?>
+    <feed xmlns="http://www.w3.org/2005/Atom">
+      <title>t</title>
+      <entry xml:base="https://ex.com/rel/"><title>a</title><link href="c"/></entry>
+      <entry><title>b</title><link href="/x/d"/></entry>
+    </feed>
+    """.strip()
+
+    class _BytesResp:
+        content = atom.encode("utf-8")
+
+    class _TextResp:
+        text = atom
+
+    feed_url = "https://feed.example.com/atom.xml"
+    streamed = [entry["link"] for entry in collector._parse_feed_entries(_BytesResp(), feed_url)]
+    parsed = [entry.link for entry in collector._parse_feed_entries(_TextResp(), feed_url)]
+
+    assert streamed == ["https://ex.com/rel/c", "https://feed.example.com/x/d"]
+    assert streamed == parsed
+
+
+def test_collect_from_sources_shares_client_and_isolates_errors() -> None:
+    """批量采集共用一个客户端，按输入顺序返回，单源异常不影响其他来源。"""
+    rss = """<?xml version="1.0" encoding="UTF-8"?>
+    <rss version="2.0"><channel><title>t</title>
+      <item><title>AI 条目</title><link>https://example.com/a/1</link>
+      <pubDate>Wed, 25 Feb 2026 02:00:00 +0800</pubDate></item>
+    </channel></rss>
+    """.strip()
+
+    class _Resp:
+        def __init__(self, text: str) -> None:
+            self.text = text
+
+        def raise_for_status(self) -> None:
+            return None
+
+    def _get(url, *args, **kwargs):
+        if "broken" in url:
+            raise RuntimeError("boom")
+        return _Resp(rss)
+
+    sources = [
+        SourceConfig(name="broken", type="rss", url="https://broken.example.com/rss.xml"),
+        SourceConfig(name="ok", type="rss", url="https://example.com/rss.xml"),
+    ]
+
+    with patch("app.collector.httpx.Client") as mock_client:
+        mock_client.return_value.__enter__.return_value.get.side_effect = _get
+        results = collect_from_sources(sources, timeout_seconds=5)
+
+    assert mock_client.call_count == 1
+    assert isinstance(results[0], RuntimeError)
+    assert [item.title for item in results[1]] == ["AI 条目"]
+
+
+def test_collect_from_sources_caps_concurrency_per_host() -> None:
+    """同一主机的在途请求（含文章页回源）受 max_per_host 限制，其他主机不受影响，结果仍按输入顺序返回。"""
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+
+    lock = threading.Lock()
+    active: dict[str, int] = {}
+    peak: dict[str, int] = {}
+    sogou_calls = [0]
+    # 前两个 sogou 请求互相等待：只有配额允许 2 个同时在途时才能通过，否则超时使该来源失败
+    overlap = threading.Barrier(2)
+
+    def _fake_get(url, **kwargs):
+        host = url.split("/")[2]
+        with lock:
+            active[host] = active.get(host, 0) + 1
+            peak[host] = max(peak.get(host, 0), active[host])
+            if host == "sogou.example.com":
+                sogou_calls[0] += 1
+                wait_for_peer = sogou_calls[0] <= 2
+            else:
+                wait_for_peer = False
+        try:
+            if wait_for_peer:
+                overlap.wait(timeout=5)
+        finally:
+            with lock:
+                active[host] -= 1
+        return url
+
+    def _fake_collect(source, client):
+        client.get(source.url)
+        # 模拟文章页并发回源
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(client.get, [f"{source.url}/detail/{i}" for i in range(8)]))
+        return source.name
+
+    sources = [SourceConfig(name=f"s{i}", type="rss", url=f"https://sogou.example.com/{i}") for i in range(6)]
+    sources += [SourceConfig(name=f"o{i}", type="rss", url=f"https://other{i}.example.com/rss") for i in range(3)]
+
+    with patch("app.collector.httpx.Client") as mock_client, patch(
+        "app.collector._collect_with_client", side_effect=_fake_collect
+    ):
+        mock_client.return_value.__enter__.return_value.get.side_effect = _fake_get
+        results = collect_from_sources(sources, timeout_seconds=5, max_per_host=2)
+
+    assert results == [source.name for source in sources]
+    assert peak["sogou.example.com"] <= 2
+    assert all(peak[f"other{i}.example.com"] <= 2 for i in range(3))
+
+
+def test_get_html_stops_reading_at_byte_cap() -> None:
+    """超大 HTML 响应读到字节上限即停止下载，其余分块不再拉取。"""
+    import httpx
+
+    served: list[int] = []
+
+    class _Body(httpx.SyncByteStream):
+        def __iter__(self):
+            for index in range(100):
+                served.append(index)
+                yield b"<p>" + b"x" * 65533 + b"</p>"
+
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, stream=_Body()))
+    with patch.object(collector, "_MAX_HTML_BYTES", 200_000), httpx.Client(transport=transport) as client:
+        resp, html = collector._get_html(client, "https://big.example.com/")
+
+    assert resp.status_code == 200
+    assert len(html) == 200_000
+    assert len(served) < 10
+
+
+def test_collect_rss_reuses_cached_items_on_not_modified() -> None:
+    """源返回 304 时携带条件请求头，并直接复用上次解析的条目。"""
+    rss = """<?xml version="1.0" encoding="UTF-8"?>
+    <rss version="2.0"><channel><title>t</title>
+      <item><title>AI 条目</title><link>https://example.com/etag/1</link>
+      <pubDate>Wed, 25 Feb 2026 02:00:00 +0800</pubDate></item>
+    </channel></rss>
+    """.strip()
+
+    class _Resp:
+        def __init__(self, text: str, status_code: int) -> None:
+            self.text = text
+            self.status_code = status_code
+            self.headers = {"ETag": '"v1"'}
+
+        def raise_for_status(self) -> None:
+            return None
+
+    calls: list[dict] = []
+
+    def _get(url, *args, **kwargs):
+        headers = kwargs.get("headers") or {}
+        calls.append(headers)
+        if headers.get("If-None-Match") == '"v1"':
+            return _Resp("", 304)
+        return _Resp(rss, 200)
+
+    source = SourceConfig(name="etag", type="rss", url="https://etag.example.com/rss.xml")
+    with patch("app.collector.httpx.Client") as mock_client:
+        mock_client.return_value.__enter__.return_value.get.side_effect = _get
+        first = collect_from_source(source, timeout_seconds=5)
+        second = collect_from_source(source, timeout_seconds=5)
+
+    assert calls[1] == {"If-None-Match": '"v1"'}
+    assert [item.url for item in first] == ["https://example.com/etag/1"]
+    assert [item.url for item in second] == ["https://example.com/etag/1"]
+
+    # 来源配置变更后不再复用旧条目，按新配置重新拉取并过滤
+    edited = source.model_copy(update={"required_keywords_any": ["不存在的关键词"]})
+    with patch("app.collector.httpx.Client") as mock_client:
+        mock_client.return_value.__enter__.return_value.get.side_effect = _get
+        third = collect_from_source(edited, timeout_seconds=5)
+
+    assert calls[2] == {}
+    assert third == []
+
+
+def test_collect_rss_retries_unresolved_items_instead_of_replaying_cache() -> None:
+    """有条目未解析出发布时间时不缓存本轮结果，下轮不带条件请求头、重新回源文章页。"""
+    rss = """<?xml version="1.0" encoding="UTF-8"?>
+    <rss version="2.0"><channel><title>t</title>
+      <item><title>AI 条目</title><link>https://example.com/etag/2</link></item>
+    </channel></rss>
+    """.strip()
+    article_pages = [
+        "<html><body>正文</body></html>",
+        '<html><head><meta property="article:published_time" content="2026-02-24T09:30:00+08:00" /></head></html>',
+    ]
+
+    class _Resp:
+        def __init__(self, text: str, status_code: int = 200) -> None:
+            self.text = text
+            self.status_code = status_code
+            self.headers = {"ETag": '"v1"'}
+
+        def raise_for_status(self) -> None:
+            return None
+
+    feed_calls: list[dict] = []
+
+    def _get(url, *args, **kwargs):
+        if url.endswith("/etag/2"):
+            return _Resp(article_pages.pop(0))
+        headers = kwargs.get("headers") or {}
+        feed_calls.append(headers)
+        if headers.get("If-None-Match") == '"v1"':
+            return _Resp("", 304)
+        return _Resp(rss)
+
+    source = SourceConfig(name="etag_retry", type="rss", url="https://etag.example.com/retry.xml")
+    with patch("app.collector.httpx.Client") as mock_client:
+        mock_client.return_value.__enter__.return_value.get.side_effect = _get
+        first = collect_from_source(source, timeout_seconds=5)
+        second = collect_from_source(source, timeout_seconds=5)
+
+    assert first == []
+    assert feed_calls[1] == {}
+    assert [item.url for item in second] == ["https://example.com/etag/2"]
+
+
 def test_extract_sogou_redirect_url() -> None:
     """可从搜狗跳转页脚本还原真实文章 URL。"""
     html = """
@@ -449,6 +918,12 @@ def test_extract_sogou_redirect_url() -> None:
     assert resolved == "https://mp.weixin.qq.com/s?src=11&timestamp=1771991109"
 
 
+def test_extract_publisher_from_text_keeps_rule_priority() -> None:
+    """高优先级规则的标记出现在低优先级规则的捕获范围内时，仍按规则优先级取值。"""
+    assert _extract_publisher_from_text("来源：作者：张三") == "张三"
+    assert _extract_publisher_from_text("来源：机器之心 本文来自微信公众号：量子位") == "量子位"
+
+
 def test_collect_html_with_sogou_redirect_and_author_filter() -> None:
     """搜狗源可按公众号名过滤，并把 /link 还原为稳定微信链接。"""
     list_html = """
@@ -1,6 +1,9 @@
+import os
+
 import yaml
 
 from app.config import load_sources
+from app.env_utils import load_local_env
 
 
 def test_load_sources_resolves_inline_env_var(tmp_path, monkeypatch) -> None:
@@ -127,3 +130,42 @@ def test_new_sources_ai_camp_caili_andy_xsignal(tmp_path, monkeypatch) -> None:
     assert "蔡荔谈AI(搜狗微信检索)" in names
     assert "Andy730(搜狗微信检索)" in names
     assert "Xsignal(虎嗅专栏)" in names
+
+
+def test_load_sources_precompiles_source_patterns(tmp_path) -> None:
+    sources_path = tmp_path / "sources.yaml"
+    sources_path.write_text(
+        yaml.safe_dump(
+            {
+                "sources": [
+                    {
+                        "name": "s1",
+                        "type": "html",
+                        "url": "https://example.com/news",
+                        "link_pattern": r"/news/\d+",
+                        "date_regex": r"\d{4}-\d{2}-\d{2}",
+                    }
+                ]
+            },
+            allow_unicode=True,
+        ),
+        encoding="utf-8",
+    )
+
+    sources = load_sources(str(sources_path))
+    assert sources[0].link_re.search("https://example.com/news/42")
+    assert sources[0].date_re.pattern == r"\d{4}-\d{2}-\d{2}"
+
+
+def test_load_local_env_reparses_changed_dotenv(tmp_path, monkeypatch) -> None:
+    monkeypatch.delenv("INFO_THIEF_TEST_KEY", raising=False)
+    monkeypatch.chdir(tmp_path)
+    env_path = tmp_path / ".env"
+    env_path.write_text("INFO_THIEF_TEST_KEY=first\n", encoding="utf-8")
+    load_local_env()
+    assert os.environ["INFO_THIEF_TEST_KEY"] == "first"
+
+    monkeypatch.delenv("INFO_THIEF_TEST_KEY")
+    env_path.write_text("export INFO_THIEF_TEST_KEY='second-value'\n", encoding="utf-8")
+    load_local_env()
+    assert os.environ["INFO_THIEF_TEST_KEY"] == "second-value"
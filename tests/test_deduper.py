@@ -29,3 +29,14 @@ def test_dedupe_url_and_title_similarity() -> None:
     out = dedupe_items([a, b, c], title_similarity_threshold=0.8)
     assert len(out) == 1
     assert "模型发布" in out[0].title
+
+
+def test_dedupe_compares_titles_across_length_buckets() -> None:
+    a = _item("1", "https://a.com/1", "OpenAI 发布新一代推理模型", "内容A")
+    b = _item("2", "https://b.com/2", "OpenAI 发布新一代推理模型！", "内容B")
+    c = _item("3", "https://c.com/3", "OpenAI 发布新一代推理模型，支持多模态输入", "内容C")
+
+    out = dedupe_items([a, b, c], title_similarity_threshold=0.92)
+    ids = {item.item_id for item in out}
+    assert len(ids) == 2
+    assert "3" in ids
@@ -1,8 +1,18 @@
+from __future__ import annotations
+
 import json
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import date
 
-from app.feishu import handle_feishu_event, push_feishu_text, split_text_for_feishu
+from app.feishu import (
+    _clear_tenant_access_token_cache,
+    _format_latest_summary,
+    _get_tenant_access_token,
+    handle_feishu_event,
+    push_feishu_text,
+    split_text_for_feishu,
+)
 from app.models import BriefItem, DailyBrief, Perspective, Settings
 
 
@@ -89,6 +99,48 @@ def test_push_feishu_text_retry_until_success() -> None:
     assert sleeps == [1]
 
 
+def test_tenant_access_token_cached_until_monotonic_deadline() -> None:
+    client = _FakeClient(
+        auth_responses=[
+            _Resp(status_code=200, payload={"code": 0, "tenant_access_token": "t1", "expire": 7200}),
+            _Resp(status_code=200, payload={"code": 0, "tenant_access_token": "t2", "expire": 7200}),
+        ],
+        msg_responses=[],
+    )
+    base_url = "https://token-cache.example.com"
+    _clear_tenant_access_token_cache("cli_cache", base_url)
+
+    clock = [1000.0]
+
+    def get() -> str:
+        return _get_tenant_access_token("cli_cache", "secret", base_url, client, now_fn=lambda: clock[0])
+
+    assert get() == "t1"
+    clock[0] += 3600
+    assert get() == "t1"
+    assert client.auth_calls == 1
+    clock[0] += 3600
+    assert get() == "t2"
+    assert client.auth_calls == 2
+    _clear_tenant_access_token_cache("cli_cache", base_url)
+
+
+def test_format_latest_summary_refreshes_when_archive_changes(tmp_path) -> None:
+    archive = tmp_path / "2026-02-24.json"
+    archive.write_text(json.dumps({"title": "日报A", "items": [{"title": "条目1"}]}, ensure_ascii=False), encoding="utf-8")
+    first = _format_latest_summary(str(tmp_path))
+    assert "日报A" in first
+    assert _format_latest_summary(str(tmp_path)) == first
+
+    archive.write_text(
+        json.dumps({"title": "日报B", "items": [{"title": "条目1"}, {"title": "条目2"}]}, ensure_ascii=False),
+        encoding="utf-8",
+    )
+    second = _format_latest_summary(str(tmp_path))
+    assert "日报B" in second
+    assert "条目数：2" in second
+
+
 def test_split_text_for_feishu_splits_long_content() -> None:
     short = "短内容"
     assert split_text_for_feishu(short) == [short]
@@ -139,6 +191,8 @@ def test_handle_feishu_event_run_command_adds_background_task() -> None:
     sent: list[str] = []
     settings = _settings()
     tasks = _FakeBackgroundTasks()
+    # 测试替身不可序列化，注入线程执行器代替默认的独立进程池
+    executor = ThreadPoolExecutor(max_workers=1)
 
     payload = {
         "header": {
@@ -178,6 +232,7 @@ def test_handle_feishu_event_run_command_adds_background_task() -> None:
             ],
             observations=["obs"],
         ),
+        pipeline_executor=executor,
     )
 
     assert result["ok"] is True
@@ -187,6 +242,7 @@ def test_handle_feishu_event_run_command_adds_background_task() -> None:
 
     task_func, task_args, task_kwargs = tasks.tasks[0]
     task_func(*task_args, **task_kwargs)
+    executor.shutdown()
     assert len(sent) >= 2
     assert any("AI 每日情报" in msg or "# test" in msg for msg in sent[1:])
 
@@ -329,3 +385,35 @@ def test_handle_feishu_event_unknown_text_returns_hint_in_p2p() -> None:
     assert result["ok"] is True
     assert len(sent) == 1
     assert "未识别到指令" in sent[0]
+
+
+def test_tenant_access_token_refresh_is_single_flight() -> None:
+    import threading
+    import time
+
+    class _SlowAuthClient:
+        def __init__(self) -> None:
+            self.auth_calls = 0
+
+        def post(self, url: str, json: dict | None = None, headers: dict | None = None):  # noqa: A002
+            self.auth_calls += 1
+            time.sleep(0.1)
+            return _Resp(status_code=200, payload={"code": 0, "tenant_access_token": "shared", "expire": 7200})
+
+    client = _SlowAuthClient()
+    base_url = "https://token-single-flight.example.com"
+    _clear_tenant_access_token_cache("cli_flight", base_url)
+
+    tokens: list[str] = []
+    threads = [
+        threading.Thread(target=lambda: tokens.append(_get_tenant_access_token("cli_flight", "secret", base_url, client)))
+        for _ in range(5)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert tokens == ["shared"] * 5
+    assert client.auth_calls == 1
+    _clear_tenant_access_token_cache("cli_flight", base_url)
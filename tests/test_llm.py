@@ -1,5 +1,9 @@
-from app.llm import VolcengineLLMClient, _extract_response_text
-from app.models import Settings
+import sqlite3
+from types import SimpleNamespace
+
+from app.llm import VolcengineLLMClient, _extract_response_text, _TokenBucket
+from app.models import Perspective, Settings
+from app.storage import StateStore
 from app.pipeline import _build_llm_client
 
 
@@ -36,3 +40,77 @@ def test_build_llm_client_uses_volcengine() -> None:
 
     client = _build_llm_client(settings)
     assert isinstance(client, VolcengineLLMClient)
+
+
+def test_volcengine_respond_uses_sqlite_cache(tmp_path) -> None:
+    calls: list[str] = []
+
+    class _Responses:
+        def create(self, model, input):  # noqa: A002
+            calls.append(input[0]["content"][0]["text"])
+            return SimpleNamespace(output_text="product" if len(calls) == 1 else f"回复{len(calls)}")
+
+    store = StateStore(str(tmp_path / "state.db"))
+    store.init_db()
+    client = VolcengineLLMClient.__new__(VolcengineLLMClient)
+    client.client = SimpleNamespace(responses=_Responses())
+    client.model = "doubao-test"
+    client.cache = store
+    client.cache_ttl_hours = 72
+
+    # 逐条分类/摘要命中缓存；导语与连通性检查每次真实请求
+    assert client.classify_perspective("标题A", "内容") == Perspective.PRODUCT
+    assert client.classify_perspective("标题A", "内容") == Perspective.PRODUCT
+    assert len(calls) == 1
+    assert client.compose_intro(["标题A"]) == "回复2"
+    assert client.compose_intro(["标题A"]) == "回复3"
+    assert client.ping() == "回复4"
+
+
+def test_cached_llm_keeps_reply_when_cache_is_locked() -> None:
+    class _LockedStore:
+        def get_llm_response(self, cache_key, ttl_hours):
+            raise sqlite3.OperationalError("database is locked")
+
+        def put_llm_response(self, cache_key, response):
+            raise sqlite3.OperationalError("database is locked")
+
+    client = VolcengineLLMClient.__new__(VolcengineLLMClient)
+    client.client = SimpleNamespace(responses=SimpleNamespace(create=lambda model, input: SimpleNamespace(output_text="technology")))
+    client.model = "doubao-test"
+    client.cache = _LockedStore()
+    client.cache_ttl_hours = 72
+
+    assert client.classify_perspective("标题", "内容") == Perspective.TECHNOLOGY
+
+
+def test_init_db_prunes_expired_llm_cache(tmp_path) -> None:
+    store = StateStore(str(tmp_path / "state.db"))
+    store.init_db()
+    store.put_llm_response("fresh", "新回复")
+    store.put_llm_response("stale", "旧回复")
+    with sqlite3.connect(store.db_path) as conn:
+        conn.execute("UPDATE llm_cache SET created_at = ? WHERE cache_key = 'stale'", ("2000-01-01T00:00:00+00:00",))
+
+    store.init_db(llm_cache_ttl_hours=72)
+
+    with sqlite3.connect(store.db_path) as conn:
+        keys = [row[0] for row in conn.execute("SELECT cache_key FROM llm_cache")]
+    assert keys == ["fresh"]
+
+
+def test_token_bucket_paces_requests_to_rate() -> None:
+    clock = [0.0]
+    sleeps: list[float] = []
+
+    def _sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+        clock[0] += seconds
+
+    bucket = _TokenBucket(120, now_fn=lambda: clock[0], sleep_fn=_sleep)
+    for _ in range(6):
+        bucket.acquire()
+
+    # 120 QPM = 每秒 2 个，初始可突发 2 个，其余 4 个各等 0.5 秒
+    assert sleeps == [0.5, 0.5, 0.5, 0.5]
+    assert clock[0] == 2.0
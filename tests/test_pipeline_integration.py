@@ -5,8 +5,8 @@ import sqlite3
 import yaml
 
 from app.llm import FallbackLLMClient
-from app.models import RawItem
-from app.pipeline import run_daily_pipeline
+from app.models import Perspective, RankedItem, RawItem
+from app.pipeline import _build_brief, run_daily_pipeline
 
 
 def test_pipeline_generates_brief_and_archives(tmp_path, monkeypatch) -> None:
@@ -333,3 +333,52 @@ def test_pipeline_push_false_does_not_mark_seen(tmp_path, monkeypatch) -> None:
     with sqlite3.connect(str(db_path)) as conn:
         seen_count = conn.execute("SELECT COUNT(*) FROM seen_items").fetchone()[0]
     assert seen_count == 0
+
+
+def test_build_brief_summarizes_concurrently_in_order() -> None:
+    import threading
+    import time
+
+    class _SlowLLM(FallbackLLMClient):
+        def __init__(self) -> None:
+            self.active = 0
+            self.peak = 0
+            self.lock = threading.Lock()
+
+        def summarize_item_structured(self, title, content, source_name, url, perspective=None):
+            with self.lock:
+                self.active += 1
+                self.peak = max(self.peak, self.active)
+            time.sleep(0.05)
+            with self.lock:
+                self.active -= 1
+            if title == "标题2":
+                raise RuntimeError("llm down")
+            return {"importance": "high", "insight": f"洞察{title}", "points": [f"{title}要点1", f"{title}要点2"]}
+
+    now = datetime.now(timezone.utc)
+    items = [
+        RankedItem(
+            item_id=str(idx),
+            source_name="s",
+            source_weight=1.0,
+            url=f"https://example.com/{idx}",
+            canonical_url=f"https://example.com/{idx}",
+            title=f"标题{idx}",
+            content="内容",
+            published_at=now,
+            discovered_at=now,
+            language="zh",
+            perspective=Perspective.PRODUCT,
+            score=1.0,
+            rank_reason="test",
+        )
+        for idx in range(4)
+    ]
+    llm = _SlowLLM()
+    brief = _build_brief(items, llm, run_time=now, tz_name="Asia/Shanghai", max_concurrency=4)
+
+    assert llm.peak > 1
+    assert [item.title for item in brief.items] == ["标题0", "标题1", "标题2", "标题3"]
+    assert brief.items[0].insight == "洞察标题0"
+    assert brief.items[2].insight != "洞察标题2"